@@ -67,8 +67,18 @@ type StatusPayload = {
     alerts_fail: number;
     summary_count: number;
   };
+  control?: {
+    ticket: number;
+    action: string;
+    queued_at: string;
+    done: boolean;
+    result: { ok?: boolean; error?: string } | null;
+  } | null;
 };
 
+// Queued engine controls that never report back (e.g. the monitor restarted) stop blocking the button after this.
+const CONTROL_WAIT_MS = 60_000;
+
 type SummaryMetrics = {
   new: number;
   pushed_ok: number;
@@ -312,6 +322,7 @@ export default function Dashboard() {
   const [status, setStatus] = useState<StatusPayload>(FALLBACK);
   const [loading, setLoading] = useState(false);
   const [engineBusy, setEngineBusy] = useState(false);
+  const [pendingControl, setPendingControl] = useState<{ ticket: number; action: string; since: number } | null>(null);
   const [pushingAll, setPushingAll] = useState(false);
 
   const [isTagManagerOpen, setIsTagManagerOpen] = useState(false);
@@ -382,17 +393,49 @@ export default function Dashboard() {
         });
         const body = await res.json();
         if (!res.ok || body?.ok === false) throw new Error(body?.error || `status ${res.status}`);
-        toast.success(`Stable 引擎操作成功: ${action.toUpperCase()}`);
+        if (body?.queued) {
+          // The outcome arrives later as status.control; keep the button busy until that ticket is done.
+          toast.loading(`Stable 引擎操作已排队: ${action.toUpperCase()}`, { id: 'engine-control' });
+          setPendingControl({ ticket: Number(body.ticket), action, since: Date.now() });
+        } else {
+          toast.success(`Stable 引擎操作成功: ${action.toUpperCase()}`);
+          setEngineBusy(false);
+        }
         fetchStatus(false);
       } catch (e: any) {
         toast.error('Stable 引擎操作失败', { description: String(e?.message || e) });
-      } finally {
         setEngineBusy(false);
       }
     },
     [fetchStatus]
   );
 
+  useEffect(() => {
+    if (!pendingControl) return;
+    const control = status.control;
+    const finish = () => {
+      setPendingControl(null);
+      setEngineBusy(false);
+    };
+    if (control && control.ticket === pendingControl.ticket && control.done) {
+      if (control.result?.ok) {
+        toast.success(`Stable 引擎操作成功: ${pendingControl.action.toUpperCase()}`, { id: 'engine-control' });
+      } else {
+        toast.error('Stable 引擎操作失败', {
+          id: 'engine-control',
+          description: String(control.result?.error || 'unknown error'),
+        });
+      }
+      finish();
+    } else if (control && control.ticket > pendingControl.ticket) {
+      toast.dismiss('engine-control');
+      finish();
+    } else if (Date.now() - pendingControl.since > CONTROL_WAIT_MS) {
+      toast.error('Stable 引擎操作结果未知', { id: 'engine-control', description: 'No result reported by /api/status' });
+      finish();
+    }
+  }, [status, pendingControl]);
+
   useEffect(() => {
     const timer = window.setInterval(() => setCurrentTime(new Date()), 1000);
     fetchStatus(false);
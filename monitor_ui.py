@@ -1,16 +1,25 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import heapq
 import json
 import os
 import re
+import signal
 import subprocess
+import sys
+import threading
 import time
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from http import HTTPStatus
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterator, List
 from urllib.parse import parse_qs, urlparse
 
 from news_notifier import (
@@ -19,14 +28,18 @@ from news_notifier import (
     DEFAULT_MAJOR_KEYWORDS,
     SUMMARY_TOPIC_RULES,
     detect_topic,
+    encode_json,
+    flush_state_writes,
     get_iran_keywords,
     get_summary_topic_rules,
     load_dotenv_simple,
     load_state,
     maybe_send_compact_summary,
     resolve_news_timezone,
-    save_state,
+    save_state_later,
     send_news_item,
+    state_write_pending,
+    top_counts,
 )
 
 
@@ -37,6 +50,21 @@ ENV_FILE = ROOT_DIR / ".env.stable"
 PROFILE_PREFIX = "STABLE"
 SHARED_ENV_FILE = Path("/Users/oscar_oliver/projects/news-pusher.shared.env")
 
+_RX_LOG_PREFIX = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}\s+\w+\s+")
+_RX_LEVEL = re.compile(r"\b(ERROR|WARNING)\b")
+_RX_PHASE = re.compile(r"开始运行|抓取失败|本轮有内容但|已推送汇总消息|已推送:|summary tz=|低分新闻已缓存|低分新闻定时汇总")
+_RX_EVENT = re.compile(r"已推送:|已推送汇总消息|低分新闻定时汇总已推送|抓取失败|summary tz=")
+# Run over the newline-joined log tail, so none of these may cross a line break.
+_RX_FAIL = re.compile(r"抓取失败:[^\S\n]*(.+)$", re.M)
+_RX_FALLBACK = re.compile(r"抓取源fallback命中:[^\S\n]*(.+?)[^\S\n]*->")
+_RX_PUSH = re.compile(r"已推送:[^\S\n]*([^|\n]+)\|")
+_RX_DELIVERY_P = re.compile(r"\bdelivery_p=(\d+)/(\d+)\b")
+_RX_DELIVERY_S = re.compile(r"\bdelivery_s=(\d+)/(\d+)\b")
+_RX_ALERTS = re.compile(r"\balerts=(\d+)/(\d+)\b")
+_RX_IRAN_TAG = re.compile(r"iran|tehran|irgc|伊朗|德黑兰", re.IGNORECASE)
+_RX_ENV_KEY = re.compile(r"^\s*([^=\s]+)\s*=")
+_RX_NOTIFIER_CMD = re.compile(r"(^|/)news_notifier\.py($| )")
+
 
 def _apply_profile_credentials(prefix: str) -> None:
     p = (prefix or "").strip().upper()
@@ -48,32 +76,47 @@ def _apply_profile_credentials(prefix: str) -> None:
         "SECONDARY_TELEGRAM_BOT_TOKEN": f"{p}_SECONDARY_TELEGRAM_BOT_TOKEN",
         "SECONDARY_TELEGRAM_CHAT_ID": f"{p}_SECONDARY_TELEGRAM_CHAT_ID",
     }
-    for dest, src in mapping.items():
-        v = (os.getenv(src) or "").strip()
-        if v:
-            os.environ[dest] = v
+    env = os.environ
+    env.update({dest: v for dest, src in mapping.items() if (v := env.get(src, "").strip())})
 
 
 def _load_runtime_env() -> None:
+    env = os.environ
     load_dotenv_simple(str(ENV_FILE))
-    shared = Path((os.getenv("SHARED_ENV_FILE") or "").strip() or str(SHARED_ENV_FILE))
+    shared = Path(env.get("SHARED_ENV_FILE", "").strip() or str(SHARED_ENV_FILE))
     if shared.exists():
         load_dotenv_simple(str(shared))
-    _apply_profile_credentials((os.getenv("APP_PROFILE") or PROFILE_PREFIX).strip() or PROFILE_PREFIX)
+    _apply_profile_credentials(env.get("APP_PROFILE", "").strip() or PROFILE_PREFIX)
 
 
 def _split_csv(raw: str) -> List[str]:
-    out: List[str] = []
-    for tok in (raw or "").split(","):
-        x = tok.strip()
-        if x and x not in out:
-            out.append(x)
-    return out
+    return _clean_tags((raw or "").split(","))
+
+
+def _clean_tags(values: List[Any]) -> List[str]:
+    # Strip, drop empties and dedupe while keeping first-seen order.
+    return list(dict.fromkeys(s for s in (str(t or "").strip() for t in values) if s))
+
+
+_ENV_MAP_CACHE: Dict[Path, tuple[int, Dict[str, str]]] = {}
+_SOURCES_CACHE: tuple[int, List[str]] | None = None
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
 
 
 def _read_env_map(path: Path) -> Dict[str, str]:
+    mtime = _mtime_ns(path)
+    cached = _ENV_MAP_CACHE.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
     out: Dict[str, str] = {}
-    if not path.exists():
+    if not mtime:
+        _ENV_MAP_CACHE[path] = (mtime, out)
         return out
     for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
         line = line.strip()
@@ -84,9 +127,20 @@ def _read_env_map(path: Path) -> Dict[str, str]:
         v = v.strip().strip('"').strip("'")
         if k:
             out[k] = v
+    _ENV_MAP_CACHE[path] = (mtime, out)
     return out
 
 
+def _source_names() -> List[str]:
+    global _SOURCES_CACHE
+    mtime = _mtime_ns(ENV_FILE)
+    if _SOURCES_CACHE and _SOURCES_CACHE[0] == mtime:
+        return _SOURCES_CACHE[1]
+    names = sorted(build_source_feeds().keys())
+    _SOURCES_CACHE = (mtime, names)
+    return names
+
+
 def _default_tags_payload() -> dict:
     categories = [{"id": str(i + 1), "name": name, "tags": list(tags)} for i, (name, tags) in enumerate(SUMMARY_TOPIC_RULES)]
     major = list(DEFAULT_MAJOR_KEYWORDS)
@@ -109,12 +163,7 @@ def _load_tags_payload() -> dict:
                     tags = item.get("tags")
                     if not name or not isinstance(tags, list):
                         continue
-                    cleaned = []
-                    for t in tags:
-                        s = str(t or "").strip()
-                        if s and s not in cleaned:
-                            cleaned.append(s)
-                    categories.append({"id": str(i + 1), "name": name, "tags": cleaned})
+                    categories.append({"id": str(i + 1), "name": name, "tags": _clean_tags(tags)})
         except Exception:
             categories = []
     if not categories:
@@ -129,21 +178,22 @@ def _upsert_env_values(updates: Dict[str, str]) -> None:
     lines = []
     if ENV_FILE.exists():
         lines = ENV_FILE.read_text(encoding="utf-8").splitlines()
+    pending = dict(updates)
+    for i, line in enumerate(lines):
+        if not pending:
+            break
+        m = _RX_ENV_KEY.match(line)
+        if m and m.group(1) in pending:
+            key = m.group(1)
+            lines[i] = f"{key}={pending.pop(key)}"
+    for key, value in pending.items():
+        lines.append(f"{key}={value}")
     for key, value in updates.items():
-        assigned = False
-        new_line = f"{key}={value}"
-        for i, line in enumerate(lines):
-            if re.match(rf"^\s*{re.escape(key)}\s*=", line):
-                lines[i] = new_line
-                assigned = True
-                break
-        if not assigned:
-            lines.append(new_line)
         os.environ[key] = value
     ENV_FILE.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
-def _save_tags_payload(data: dict) -> dict:
+def _save_tags_payload(data: dict, sync: bool = False) -> dict:
     categories = data.get("categories")
     if not isinstance(categories, list) or not categories:
         return {"ok": False, "error": "categories must be a non-empty list"}
@@ -155,44 +205,21 @@ def _save_tags_payload(data: dict) -> dict:
         tags = item.get("tags")
         if not name or not isinstance(tags, list):
             continue
-        cleaned: List[str] = []
-        for t in tags:
-            s = str(t or "").strip()
-            if s and s not in cleaned:
-                cleaned.append(s)
-        normalized.append({"id": str(i + 1), "name": name, "tags": cleaned})
+        normalized.append({"id": str(i + 1), "name": name, "tags": _clean_tags(tags)})
     if not normalized:
         return {"ok": False, "error": "no valid categories"}
 
     major = data.get("major_keywords")
     if not isinstance(major, list):
-        merged: List[str] = []
-        for c in normalized:
-            for t in c["tags"]:
-                if t not in merged:
-                    merged.append(t)
-        major = merged
-    major_clean = []
-    for t in major:
-        s = str(t or "").strip()
-        if s and s not in major_clean:
-            major_clean.append(s)
+        major = [t for c in normalized for t in c["tags"]]
+    major_clean = _clean_tags(major)
 
     iran = data.get("iran_keywords")
     if not isinstance(iran, list):
         # Fallback: infer from all tags + existing defaults.
-        inferred: List[str] = []
-        for c in normalized:
-            for t in c["tags"]:
-                lower = t.lower()
-                if any(x in lower for x in ("iran", "tehran", "irgc", "伊朗", "德黑兰")) and t not in inferred:
-                    inferred.append(t)
+        inferred = list(dict.fromkeys(t for c in normalized for t in c["tags"] if _RX_IRAN_TAG.search(t)))
         iran = inferred or list(get_iran_keywords())
-    iran_clean = []
-    for t in iran:
-        s = str(t or "").strip()
-        if s and s not in iran_clean:
-            iran_clean.append(s)
+    iran_clean = _clean_tags(iran)
     if not iran_clean:
         iran_clean = list(DEFAULT_IRAN_KEYWORDS)
 
@@ -203,13 +230,19 @@ def _save_tags_payload(data: dict) -> dict:
         "IRAN_RELATED_KEYWORDS": ",".join(iran_clean),
     }
     _upsert_env_values(updates)
-    restart = _control_notifier("restart")
+    if sync:
+        restart = _control_notifier("restart")
+        restarted = bool(restart.get("ok"))
+    else:
+        # Outcome is reported later under "control" in /api/status.
+        restart = _queue_control("restart")
+        restarted = None
     return {
         "ok": True,
         "categories": normalized,
         "major_keywords": major_clean,
         "iran_keywords": iran_clean,
-        "notifier_restarted": bool(restart.get("ok")),
+        "notifier_restarted": restarted,
         "notifier_restart_result": restart,
     }
 
@@ -221,22 +254,69 @@ def _shell(cmd: List[str]) -> str:
         return ""
 
 
-def _notifier_pids() -> List[str]:
+_PIDS_CACHE: tuple[float, List[str]] = (0.0, [])
+_PIDS_TTL_SECONDS = 1.0
+
+
+def _is_notifier_cmd(cmd: str) -> bool:
     # Match both absolute-path launches and cwd-relative launches.
-    raw = []
-    raw.extend(_shell(["pgrep", "-f", str(ROOT_DIR / "news_notifier.py")]).splitlines())
-    raw.extend(_shell(["pgrep", "-f", r"(^|/)news_notifier\.py($| )"]).splitlines())
-    seen = set()
+    return str(ROOT_DIR / "news_notifier.py") in cmd or bool(_RX_NOTIFIER_CMD.search(cmd))
+
+
+def _proc_notifier_pids() -> List[str] | None:
+    # Linux: scan /proc directly instead of forking pgrep twice per request.
+    try:
+        entries = [d.name for d in os.scandir("/proc") if d.name.isdigit()]
+    except OSError:
+        return None
+    self_pid = str(os.getpid())
     out: List[str] = []
-    for pid in raw:
-        p = pid.strip()
-        if not p or p in seen:
+    for pid in sorted(entries, key=int):
+        if pid == self_pid:
             continue
-        seen.add(p)
-        out.append(p)
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                raw = f.read()
+        except OSError:
+            continue
+        if b"news_notifier" not in raw:
+            continue
+        cmd = raw.rstrip(b"\0").replace(b"\0", b" ").decode("utf-8", errors="ignore")
+        if _is_notifier_cmd(cmd):
+            out.append(pid)
     return out
 
 
+def _pgrep_notifier_pids() -> List[str]:
+    # One pgrep listing pid + full command line, filtered here. BSD/macOS spells it -lf.
+    list_flag = "-lf" if sys.platform == "darwin" else "-af"
+    pids: List[str] = []
+    for row in _shell(["pgrep", list_flag, r"news_notifier\.py"]).splitlines():
+        pid, _, cmd = row.strip().partition(" ")
+        if pid.isdigit() and _is_notifier_cmd(cmd):
+            pids.append(pid)
+    return list(dict.fromkeys(pids))
+
+
+def _invalidate_pids_cache() -> None:
+    global _PIDS_CACHE
+    _PIDS_CACHE = (0.0, [])
+    _TTL_CACHE.clear()
+
+
+def _notifier_pids() -> List[str]:
+    global _PIDS_CACHE
+    now = time.monotonic()
+    cached_at, cached = _PIDS_CACHE
+    if cached_at and now - cached_at < _PIDS_TTL_SECONDS:
+        return list(cached)
+    out = _proc_notifier_pids()
+    if out is None:
+        out = _pgrep_notifier_pids()
+    _PIDS_CACHE = (now, out)
+    return list(out)
+
+
 def _start_notifier() -> dict:
     pids = _notifier_pids()
     if pids:
@@ -251,6 +331,7 @@ def _start_notifier() -> dict:
                 start_new_session=True,
             )
         time.sleep(0.5)
+        _invalidate_pids_cache()
         return {"ok": True, "action": "start", "already_running": False, "pid": proc.pid, "pids": _notifier_pids()}
     except Exception as exc:
         return {"ok": False, "action": "start", "error": str(exc)}
@@ -269,6 +350,7 @@ def _stop_notifier() -> dict:
         except Exception:
             failed.append(p)
     time.sleep(0.3)
+    _invalidate_pids_cache()
     remain = _notifier_pids()
     return {
         "ok": len(failed) == 0,
@@ -291,44 +373,214 @@ def _control_notifier(action: str) -> dict:
     return {"ok": False, "error": f"Unsupported action: {action}"}
 
 
+# Start/stop sleep while waiting for the process table to settle; run them on a
+# single background worker so request threads return immediately.
+_CONTROL_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notifier-control")
+# (ticket, action, queued_at, future); replaced as a whole so readers never pair one
+# control's action with another's future.
+_LAST_CONTROL: tuple[int, str, str, Future] | None = None
+_CONTROL_TICKET_LOCK = threading.Lock()
+_CONTROL_TICKET = 0
+
+
+def _queue_control(action: str) -> dict:
+    global _LAST_CONTROL, _CONTROL_TICKET
+    action = (action or "").strip().lower()
+    if action not in ("start", "stop", "restart"):
+        return {"ok": False, "error": f"Unsupported action: {action}"}
+    queued_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    with _CONTROL_TICKET_LOCK:
+        _CONTROL_TICKET += 1
+        ticket = _CONTROL_TICKET
+        _LAST_CONTROL = (ticket, action, queued_at, _CONTROL_POOL.submit(_control_notifier, action))
+    # A cached /api/status must not hide the new ticket from the poller waiting on it.
+    _TTL_CACHE.clear()
+    return {"ok": True, "queued": True, "ticket": ticket, "action": action, "queued_at": queued_at}
+
+
+def _control_status() -> dict | None:
+    last = _LAST_CONTROL
+    if last is None:
+        return None
+    ticket, action, queued_at, future = last
+    done = future.done()
+    result = None
+    if done:
+        try:
+            result = future.result()
+        except Exception as exc:
+            result = {"ok": False, "error": str(exc)}
+    return {"ticket": ticket, "action": action, "queued_at": queued_at, "done": done, "result": result}
+
+
+_TTL_CACHE: Dict[str, tuple[float, Any]] = {}
+_TTL_LOCKS: Dict[str, threading.Lock] = {}
+
+
+def _status_ttl() -> float:
+    try:
+        return float(os.getenv("UI_STATUS_TTL", "1.0"))
+    except ValueError:
+        return 1.0
+
+
+def _ttl_cached(key: str, build: Callable[[], Any]) -> Any:
+    # Dashboard tabs poll in bursts; serve one build per TTL window to all of them.
+    ttl = _status_ttl()
+    if ttl <= 0:
+        return build()
+    hit = _TTL_CACHE.get(key)
+    if hit and time.monotonic() - hit[0] < ttl:
+        return hit[1]
+    with _TTL_LOCKS.setdefault(key, threading.Lock()):
+        hit = _TTL_CACHE.get(key)
+        if hit and time.monotonic() - hit[0] < ttl:
+            return hit[1]
+        value = build()
+        _TTL_CACHE[key] = (time.monotonic(), value)
+        return value
+
+
+_STATE_CACHE: tuple[int, int, dict] | None = None
+
+
+def _read_state() -> dict:
+    # Read-only views share one parsed copy of the state file until it changes on disk.
+    global _STATE_CACHE
+    try:
+        st = STATE_FILE.stat()
+    except OSError:
+        return load_state(STATE_FILE)
+    cached = _STATE_CACHE
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    state = load_state(STATE_FILE)
+    _STATE_CACHE = (st.st_mtime_ns, st.st_size, state)
+    return state
+
+
+_TAIL_CACHE: Dict[Path, dict] = {}
+_TAIL_LOCK = threading.Lock()
+_TAIL_ANCHOR_BYTES = 64
+
+
+def _split_log_bytes(data: bytes) -> tuple[List[str], List[str], int]:
+    # Complete lines, the trailing unterminated line (if any), and bytes consumed.
+    cut = data.rfind(b"\n") + 1
+    lines = data[:cut].decode("utf-8", errors="ignore").splitlines()
+    rest = data[cut:].decode("utf-8", errors="ignore").splitlines()
+    return lines, rest, cut
+
+
+def _read_tail_lines(path: Path, size: int, max_lines: int) -> tuple[List[str], List[str], int, bytes]:
+    # Read only the end of the file; widen the window until it holds enough lines.
+    want = max(1, max_lines) * 512
+    with path.open("rb") as f:
+        while True:
+            start = max(0, size - want)
+            f.seek(start)
+            data = f.read(size - start)
+            lines, rest, cut = _split_log_bytes(data)
+            if start > 0:
+                # first line may be partial
+                if lines:
+                    lines = lines[1:]
+                else:
+                    rest = rest[1:]
+            if len(lines) + len(rest) >= max_lines or start == 0:
+                return lines[-max_lines:], rest, start + cut, data[max(0, cut - _TAIL_ANCHOR_BYTES) : cut]
+            want *= 2
+
+
+def _read_appended_lines(path: Path, cached: dict, size: int) -> tuple[List[str], List[str], int, bytes] | None:
+    # Read only the bytes written since the last call. The bytes just before the
+    # previous offset must be unchanged, otherwise the file was rewritten in place.
+    pos = cached["pos"]
+    anchor = cached["anchor"]
+    with path.open("rb") as f:
+        f.seek(pos - len(anchor))
+        data = f.read(size - pos + len(anchor))
+    if not data.startswith(anchor):
+        return None
+    data = data[len(anchor) :]
+    lines, rest, cut = _split_log_bytes(data)
+    if cut:
+        anchor = (anchor + data[:cut])[-_TAIL_ANCHOR_BYTES:]
+    return lines, rest, pos + cut, anchor
+
+
 def _tail(path: Path, max_lines: int = 120) -> List[str]:
-    if not path.exists():
+    # Cached lines are extended in place; keep concurrent requests out of each other's way.
+    with _TAIL_LOCK:
+        return _tail_cached(path, max_lines)
+
+
+def _tail_cached(path: Path, max_lines: int) -> List[str]:
+    try:
+        st = path.stat()
+    except OSError:
         return []
+    cached = _TAIL_CACHE.get(path)
+    if cached and cached["ino"] == st.st_ino and max_lines <= cached["keep"]:
+        if cached["mtime"] == st.st_mtime_ns and cached["size"] == st.st_size:
+            return (cached["lines"] + cached["rest"])[-max_lines:]
+        if st.st_size >= cached["size"]:
+            try:
+                appended = _read_appended_lines(path, cached, st.st_size)
+            except Exception:
+                appended = None
+            if appended is not None:
+                new_lines, rest, pos, anchor = appended
+                lines = cached["lines"]
+                lines.extend(new_lines)
+                if len(lines) > cached["keep"]:
+                    del lines[: len(lines) - cached["keep"]]
+                cached.update(mtime=st.st_mtime_ns, size=st.st_size, pos=pos, anchor=anchor, rest=rest)
+                return (lines + rest)[-max_lines:]
     try:
-        data = path.read_text(encoding="utf-8", errors="ignore").splitlines()
-        return data[-max_lines:]
+        keep = max(max_lines, cached["keep"] if cached else 0)
+        lines, rest, pos, anchor = _read_tail_lines(path, st.st_size, keep)
     except Exception:
         return []
+    _TAIL_CACHE[path] = {
+        "ino": st.st_ino,
+        "mtime": st.st_mtime_ns,
+        "size": st.st_size,
+        "keep": keep,
+        "pos": pos,
+        "anchor": anchor,
+        "lines": lines,
+        "rest": rest,
+    }
+    return (lines + rest)[-max_lines:]
 
 
-def _last_line(lines: List[str], pattern: str) -> str:
-    rx = re.compile(pattern)
-    for line in reversed(lines):
-        if rx.search(line):
-            return line
-    return ""
+def _has_log_ts(line: str) -> bool:
+    # Fixed-width "YYYY-MM-DD HH:MM:SS,mmm" prefix; checked by position instead of regex.
+    if len(line) < 23 or line[4] != "-" or line[7] != "-" or line[10] != " ":
+        return False
+    if line[13] != ":" or line[16] != ":" or line[19] != ",":
+        return False
+    digits = line[0:4] + line[5:7] + line[8:10] + line[11:13] + line[14:16] + line[17:19] + line[20:23]
+    return digits.isascii() and digits.isdigit()
 
 
 def _log_time_str(line: str) -> str:
-    m = re.match(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d{3}", line or "")
-    return m.group(1) if m else ""
+    return line[:19] if line and _has_log_ts(line) else ""
 
 
 def _parse_log_time(line: str) -> datetime | None:
-    m = re.match(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d{3}", line or "")
-    if not m:
+    if not line or not _has_log_ts(line):
         return None
     try:
-        return datetime.strptime(m.group(1), "%Y-%m-%d %H:%M:%S")
-    except Exception:
+        return datetime(
+            int(line[0:4]), int(line[5:7]), int(line[8:10]), int(line[11:13]), int(line[14:16]), int(line[17:19])
+        )
+    except ValueError:
         return None
 
 
-def _infer_phase(lines: List[str]) -> str:
-    last = _last_line(
-        lines,
-        r"开始运行|抓取失败|本轮有内容但|已推送汇总消息|已推送:|summary tz=|低分新闻已缓存|低分新闻定时汇总",
-    )
+def _phase_from_line(last: str) -> str:
     if not last:
         return "idle"
     if "抓取失败" in last:
@@ -346,34 +598,23 @@ def _infer_phase(lines: List[str]) -> str:
     return "idle"
 
 
-def _recent_events(lines: List[str], limit: int = 12) -> List[str]:
-    out = []
-    for line in reversed(lines):
-        if re.search(r"已推送:|已推送汇总消息|低分新闻定时汇总已推送|抓取失败|summary tz=", line):
-            out.append(line)
-        if len(out) >= limit:
-            break
-    out.reverse()
-    return out
-
-
 def _topic_buckets(low_score_buffer: List[dict]) -> List[dict]:
-    buckets: Dict[str, dict] = {}
+    counts: Counter = Counter()
+    heat_sums: Dict[str, float] = defaultdict(float)
+    sources_by_topic: Dict[str, Counter] = defaultdict(Counter)
+    items_by_topic: Dict[str, List[dict]] = defaultdict(list)
     for item in low_score_buffer:
         source = item.get("source") or "Unknown"
         entry = item.get("entry") or {}
         title = (entry.get("title") or "").strip()
         topic = detect_topic(title)
         heat = float(item.get("heat") or 0.0)
-        bucket = buckets.setdefault(
-            topic,
-            {"topic": topic, "count": 0, "avg_heat": 0.0, "items": [], "sources": {}},
-        )
-        bucket["count"] += 1
-        bucket["avg_heat"] += heat
-        bucket["sources"][source] = bucket["sources"].get(source, 0) + 1
-        if len(bucket["items"]) < 30:
-            bucket["items"].append(
+        counts[topic] += 1
+        heat_sums[topic] += heat
+        sources_by_topic[topic][source] += 1
+        topic_items = items_by_topic[topic]
+        if len(topic_items) < 30:
+            topic_items.append(
                 {
                     "title": title,
                     "source": source,
@@ -383,12 +624,16 @@ def _topic_buckets(low_score_buffer: List[dict]) -> List[dict]:
                 }
             )
     out = []
-    for v in buckets.values():
-        c = max(1, v["count"])
-        v["avg_heat"] = round(v["avg_heat"] / c, 2)
-        v["top_sources"] = sorted(v["sources"].items(), key=lambda kv: (-kv[1], kv[0]))[:5]
-        del v["sources"]
-        out.append(v)
+    for topic, count in counts.items():
+        out.append(
+            {
+                "topic": topic,
+                "count": count,
+                "avg_heat": round(heat_sums[topic] / max(1, count), 2),
+                "items": items_by_topic[topic],
+                "top_sources": top_counts(sources_by_topic[topic], 5),
+            }
+        )
     out.sort(key=lambda x: (-x["count"], -x["avg_heat"], x["topic"]))
     return out
 
@@ -402,9 +647,9 @@ def _parse_delivery_from_summary(line: str) -> dict:
         "alerts_sent": 0,
         "alerts_fail": 0,
     }
-    m_p = re.search(r"\bdelivery_p=(\d+)/(\d+)\b", line or "")
-    m_s = re.search(r"\bdelivery_s=(\d+)/(\d+)\b", line or "")
-    m_a = re.search(r"\balerts=(\d+)/(\d+)\b", line or "")
+    m_p = _RX_DELIVERY_P.search(line or "")
+    m_s = _RX_DELIVERY_S.search(line or "")
+    m_a = _RX_ALERTS.search(line or "")
     if m_p:
         parsed["primary"]["ok"] = int(m_p.group(1))
         parsed["primary"]["fail"] = int(m_p.group(2))
@@ -417,10 +662,30 @@ def _parse_delivery_from_summary(line: str) -> dict:
     return parsed
 
 
-def _rolling_delivery(lines: List[str], hours: int = 1) -> dict:
-    now = datetime.now()
-    since = now - timedelta(hours=hours)
-    out = {
+def _add_summary_delivery(out: dict, line: str) -> None:
+    one = _parse_delivery_from_summary(line)
+    out["summary_count"] += 1
+    out["primary"]["ok"] += one["primary"]["ok"]
+    out["primary"]["fail"] += one["primary"]["fail"]
+    out["secondary"]["ok"] += one["secondary"]["ok"]
+    out["secondary"]["fail"] += one["secondary"]["fail"]
+    out["alerts_sent"] += one["alerts_sent"]
+    out["alerts_fail"] += one["alerts_fail"]
+
+
+def _error_item(line: str, level: str) -> dict:
+    return {
+        "time": _log_time_str(line),
+        "level": level,
+        "line": line,
+        "message": _RX_LOG_PREFIX.sub("", line),
+    }
+
+
+def _scan_log(lines: List[str], *, hours: int = 1, event_limit: int = 12, error_limit: int = 20) -> dict:
+    # One newest-first pass that fills every log-derived field of /api/status.
+    since = datetime.now() - timedelta(hours=hours)
+    rolling = {
         "window_hours": hours,
         "primary": {"ok": 0, "fail": 0},
         "secondary": {"ok": 0, "fail": 0},
@@ -428,43 +693,44 @@ def _rolling_delivery(lines: List[str], hours: int = 1) -> dict:
         "alerts_fail": 0,
         "summary_count": 0,
     }
-    for line in lines:
-        if "summary tz=" not in line:
-            continue
-        dt = _parse_log_time(line)
-        if not dt or dt < since:
-            continue
-        one = _parse_delivery_from_summary(line)
-        out["summary_count"] += 1
-        out["primary"]["ok"] += one["primary"]["ok"]
-        out["primary"]["fail"] += one["primary"]["fail"]
-        out["secondary"]["ok"] += one["secondary"]["ok"]
-        out["secondary"]["fail"] += one["secondary"]["fail"]
-        out["alerts_sent"] += one["alerts_sent"]
-        out["alerts_fail"] += one["alerts_fail"]
-    return out
-
-
-def _recent_error_items(lines: List[str], limit: int = 20) -> List[dict]:
-    items: List[dict] = []
+    last_start = last_summary = last_push = last_error = last_phase = ""
+    events: List[str] = []
+    errors: List[dict] = []
     for line in reversed(lines):
-        if not re.search(r"\b(ERROR|WARNING)\b", line):
-            continue
-        level_match = re.search(r"\b(ERROR|WARNING)\b", line)
-        level = level_match.group(1) if level_match else "ERROR"
-        items.append(
-            {
-                "time": _log_time_str(line),
-                "level": level,
-                "line": line,
-                "message": re.sub(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}\s+\w+\s+", "", line),
-            }
-        )
-        if len(items) >= limit:
-            break
-    return items
+        if not last_start and "开始运行" in line:
+            last_start = line
+        if "summary tz=" in line:
+            if not last_summary:
+                last_summary = line
+            dt = _parse_log_time(line)
+            if dt and dt >= since:
+                _add_summary_delivery(rolling, line)
+        if not last_push and ("已推送汇总消息" in line or "已推送:" in line):
+            last_push = line
+        if not last_error and ("ERROR" in line or "WARNING" in line):
+            last_error = line
+        if not last_phase and _RX_PHASE.search(line):
+            last_phase = line
+        if len(events) < event_limit and _RX_EVENT.search(line):
+            events.append(line)
+        if len(errors) < error_limit:
+            level_match = _RX_LEVEL.search(line)
+            if level_match:
+                errors.append(_error_item(line, level_match.group(1)))
+    events.reverse()
+    return {
+        "last_start": last_start,
+        "last_summary": last_summary,
+        "last_push": last_push,
+        "last_error": last_error,
+        "phase": _phase_from_line(last_phase),
+        "recent_events": events,
+        "recent_errors": errors,
+        "delivery": rolling,
+    }
 
 
+@lru_cache(maxsize=8192)
 def _parse_iso(ts: str) -> datetime | None:
     s = (ts or "").strip()
     if not s:
@@ -475,21 +741,89 @@ def _parse_iso(ts: str) -> datetime | None:
         return None
 
 
+def _utc_ts_z(epoch: float | None = None) -> str:
+    # "YYYY-MM-DDTHH:MM:SSZ" straight from gmtime; no datetime/isoformat/replace round trip.
+    return "%04d-%02d-%02dT%02d:%02d:%02dZ" % time.gmtime(epoch)[:6]
+
+
+def _utc_cutoff_key(cutoff: datetime) -> str:
+    # Smallest whole-second "YYYY-MM-DDTHH:MM:SSZ" that is not before cutoff.
+    utc = cutoff.astimezone(timezone.utc)
+    if utc.microsecond:
+        utc = utc.replace(microsecond=0) + timedelta(seconds=1)
+    return utc.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _is_utc_stamp(ts: Any) -> bool:
+    return isinstance(ts, str) and len(ts) == 20 and ts[19] == "Z" and ts[10] == "T" and ts[4] == "-"
+
+
+def _is_older(ts: str, cutoff: datetime, cutoff_key: str) -> bool:
+    # Canonical UTC stamps compare as strings; anything else goes through _parse_iso.
+    if _is_utc_stamp(ts):
+        return ts < cutoff_key
+    dt = _parse_iso(ts)
+    return bool(dt and dt.astimezone() < cutoff)
+
+
+def _prune_history(rows: List[dict], cutoff: datetime, max_rows: int) -> None:
+    # In place: drop rows older than cutoff, then cap to the newest max_rows.
+    # Rows are dicts (see _validate_state).
+    cutoff_key = _utc_cutoff_key(cutoff)
+    idx = None
+    # Rows are appended in time order with canonical UTC stamps: binary-search the
+    # first row to keep. Anything that breaks that shape takes the full scan.
+    if rows:
+        first, last = rows[0].get("ts"), rows[-1].get("ts")
+        if _is_utc_stamp(first) and _is_utc_stamp(last) and first <= last:
+            try:
+                idx = bisect_left(rows, cutoff_key, key=lambda row: row.get("ts") or "")
+            except TypeError:
+                idx = None
+    # The dropped prefix is normally tiny; re-check it so stray untimed rows are kept.
+    end = len(rows) if idx is None else idx
+    rows[:end] = [row for row in rows[:end] if not _is_older(str(row.get("ts") or ""), cutoff, cutoff_key)]
+    if len(rows) > max_rows:
+        del rows[: len(rows) - max_rows]
+
+
+def _history_rows_sorted(rows: List[Any], cutoff: datetime, limit: int) -> List[dict]:
+    cutoff_key = _utc_cutoff_key(cutoff)
+    # One pass: canonical stamps are a plain string compare, the rest take _is_older.
+    out = [
+        row
+        for row in rows
+        if isinstance(row, dict)
+        and (
+            ts >= cutoff_key
+            if _is_utc_stamp(ts := row.get("ts"))
+            else not _is_older(str(ts or ""), cutoff, cutoff_key)
+        )
+    ]
+    out.sort(key=lambda x: str(x.get("ts") or ""), reverse=True)
+    return out[:limit]
+
+
 def _history_rows(state: dict, key: str, *, days: int = 7, limit: int = 500) -> List[dict]:
     rows = state.get(key, [])
     if not isinstance(rows, list):
         return []
     cutoff = datetime.now().astimezone() - timedelta(days=max(1, days))
-    out: List[dict] = []
-    for row in rows:
-        if not isinstance(row, dict):
-            continue
-        dt = _parse_iso(str(row.get("ts") or ""))
-        if dt and dt.astimezone() < cutoff:
-            continue
-        out.append(row)
-    out.sort(key=lambda x: str(x.get("ts") or ""), reverse=True)
-    return out[: max(1, limit)]
+    limit = max(1, limit)
+    # History is normally appended oldest-first with canonical UTC stamps; then the rows
+    # inside the window are an already ordered suffix. Confirm that shape over the whole
+    # list first: any unordered, untimed or non-canonical row takes the full filter + sort.
+    stamps = [row.get("ts") if isinstance(row, dict) else None for row in rows]
+    if not all(_is_utc_stamp(ts) for ts in stamps) or any(a > b for a, b in zip(stamps, stamps[1:])):
+        return _history_rows_sorted(rows, cutoff, limit)
+    out = rows[bisect_left(stamps, _utc_cutoff_key(cutoff)) :]
+    out.sort(key=lambda x: x["ts"], reverse=True)
+    return out[:limit]
+
+
+def _stripped(d: dict, key: str) -> str:
+    v = d.get(key)
+    return v.strip() if v else ""
 
 
 def _safe_int(raw: str | None, default: int) -> int:
@@ -499,24 +833,28 @@ def _safe_int(raw: str | None, default: int) -> int:
         return default
 
 
-def _source_status_payload(lines: List[str]) -> dict:
-    source_names = sorted(build_source_feeds().keys())
+def _line_matches(rx: re.Pattern, text: str) -> Iterator[tuple[re.Match, int, int]]:
+    # First match per line, oldest line first, with the (start, end) span of its line.
+    prev_start = -1
+    for m in rx.finditer(text):
+        start = text.rfind("\n", 0, m.start()) + 1
+        if start == prev_start:
+            continue
+        prev_start = start
+        end = text.find("\n", m.end())
+        yield m, start, (len(text) if end < 0 else end)
+
+
+def _source_status_payload(text: str) -> dict:
+    source_names = _source_names()
+    # Later matches overwrite earlier ones, so each source keeps its newest line.
     recent_fail: Dict[str, str] = {}
+    for m, start, end in _line_matches(_RX_FAIL, text):
+        recent_fail[m.group(1).strip()] = text[start:end]
     recent_fallback: Dict[str, str] = {}
-    recent_push_count: Dict[str, int] = {}
-    for line in reversed(lines):
-        m_fail = re.search(r"抓取失败:\s*(.+)$", line)
-        if m_fail:
-            src = m_fail.group(1).strip()
-            recent_fail.setdefault(src, line)
-        m_fb = re.search(r"抓取源fallback命中:\s*(.+?)\s*->", line)
-        if m_fb:
-            src = m_fb.group(1).strip()
-            recent_fallback.setdefault(src, line)
-        m_push = re.search(r"已推送:\s*([^|]+)\|", line)
-        if m_push:
-            src = m_push.group(1).strip()
-            recent_push_count[src] = recent_push_count.get(src, 0) + 1
+    for m, start, end in _line_matches(_RX_FALLBACK, text):
+        recent_fallback[m.group(1).strip()] = text[start:end]
+    recent_push_count = Counter(m.group(1).strip() for m, _, _ in _line_matches(_RX_PUSH, text))
 
     items = []
     for src in source_names:
@@ -524,7 +862,7 @@ def _source_status_payload(lines: List[str]) -> dict:
         last_error = ""
         if src in recent_fail:
             status = "ERROR"
-            last_error = re.sub(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}\s+\w+\s+", "", recent_fail[src])
+            last_error = _RX_LOG_PREFIX.sub("", recent_fail[src])
         elif src in recent_fallback:
             status = "WARN"
         items.append(
@@ -545,10 +883,53 @@ def _source_status_payload(lines: List[str]) -> dict:
     }
 
 
+def _tail_text(path: Path, max_lines: int = 120) -> str:
+    return "\n".join(_tail(path, max_lines))
+
+
+def _sources_payload() -> dict:
+    return _source_status_payload(_tail_text(LOG_FILE, max_lines=3000))
+
+
+def _engine_timer_payload() -> dict:
+    state = _read_state()
+    poll_seconds = int(os.getenv("POLL_SECONDS", "120"))
+    last_run = state.get("last_run", {}) if isinstance(state.get("last_run"), dict) else {}
+    utc_str = str(last_run.get("utc") or "")
+    dt = _parse_iso(utc_str)
+    running = bool(_notifier_pids())
+    seconds_since = None
+    if dt:
+        seconds_since = int((datetime.now(timezone.utc) - dt.astimezone(timezone.utc)).total_seconds())
+    if seconds_since is None:
+        seconds_left = poll_seconds if running else 0
+    else:
+        seconds_left = max(0, poll_seconds - (seconds_since % poll_seconds)) if running else 0
+    return {
+        "ok": True,
+        "running": running,
+        "poll_seconds": poll_seconds,
+        "seconds_since_last_cycle": seconds_since,
+        "seconds_to_next_cycle": seconds_left,
+    }
+
+
 def _details_payload(path: str) -> tuple[int, dict]:
     parsed = urlparse(path)
     qs = parse_qs(parsed.query or "")
-    state = load_state(STATE_FILE)
+
+    if parsed.path == "/api/details/sources":
+        payload = _ttl_cached("sources", _sources_payload)
+        status_filter = ((qs.get("status") or [""])[0] or "").strip().upper()
+        if status_filter:
+            items = [x for x in payload["items"] if str(x.get("status") or "").upper() == status_filter]
+            payload = {**payload, "items": items, "count": len(items)}
+        return HTTPStatus.OK, payload
+
+    if parsed.path == "/api/engine/timer":
+        return HTTPStatus.OK, _engine_timer_payload()
+
+    state = _read_state()
     days = _safe_int((qs.get("days") or [None])[0], 7)
     limit = _safe_int((qs.get("limit") or [None])[0], 300)
 
@@ -581,38 +962,36 @@ def _details_payload(path: str) -> tuple[int, dict]:
             low_buffer = []
         if not isinstance(night_buffer, list):
             night_buffer = []
-        merged = []
-        for item in low_buffer:
-            if isinstance(item, dict):
-                x = dict(item)
-                x["_queue"] = "low_score_buffer"
-                merged.append(x)
-        for item in night_buffer:
-            if isinstance(item, dict):
-                x = dict(item)
-                x["_queue"] = "night_buffer"
-                merged.append(x)
+        # Pair each buffered item with its queue name rather than copying it.
+        merged = [(item, "low_score_buffer") for item in low_buffer if isinstance(item, dict)]
+        merged.extend((item, "night_buffer") for item in night_buffer if isinstance(item, dict))
+        candidates = [
+            (
+                datetime.fromtimestamp(int(item.get("buffered_ts") or 0)).astimezone().isoformat() if item.get("buffered_ts") else "",
+                item,
+                queue,
+            )
+            for item, queue in merged[: max(1, limit) * 2]
+        ]
+        # Pick the newest rows first; only those get a topic and an output dict.
         rows = []
-        for item in merged[: max(1, limit) * 2]:
-            if not isinstance(item, dict):
-                continue
+        for ts, item, queue in heapq.nlargest(max(1, limit), candidates, key=itemgetter(0)):
             entry = item.get("entry") if isinstance(item.get("entry"), dict) else {}
             title = (entry.get("title") or "").strip()
             rows.append(
                 {
-                    "ts": datetime.fromtimestamp(int(item.get("buffered_ts") or 0)).astimezone().isoformat() if item.get("buffered_ts") else "",
+                    "ts": ts,
                     "source": item.get("source") or "Unknown",
                     "uid": item.get("uid") or "",
                     "heat": float(item.get("heat") or 0.0),
                     "topic": detect_topic(title),
-                    "queue": item.get("_queue") or "",
+                    "queue": queue,
                     "title": title,
                     "link": (entry.get("link") or "").strip(),
                     "published": (entry.get("published") or "").strip(),
                 }
             )
-        rows.sort(key=lambda x: str(x.get("ts") or ""), reverse=True)
-        return HTTPStatus.OK, {"ok": True, "count": len(rows), "items": rows[: max(1, limit)]}
+        return HTTPStatus.OK, {"ok": True, "count": len(candidates), "items": rows}
 
     if parsed.path == "/api/details/low-topics":
         low_buffer = state.get("low_score_buffer", [])
@@ -624,41 +1003,11 @@ def _details_payload(path: str) -> tuple[int, dict]:
             topics = [t for t in topics if str(t.get("topic") or "") == topic]
         return HTTPStatus.OK, {"ok": True, "count": len(topics), "items": topics}
 
-    if parsed.path == "/api/details/sources":
-        lines = _tail(LOG_FILE, max_lines=3000)
-        payload = _source_status_payload(lines)
-        status_filter = ((qs.get("status") or [""])[0] or "").strip().upper()
-        if status_filter:
-            payload["items"] = [x for x in payload["items"] if str(x.get("status") or "").upper() == status_filter]
-            payload["count"] = len(payload["items"])
-        return HTTPStatus.OK, payload
-
-    if parsed.path == "/api/engine/timer":
-        poll_seconds = int(os.getenv("POLL_SECONDS", "120"))
-        last_run = state.get("last_run", {}) if isinstance(state.get("last_run"), dict) else {}
-        utc_str = str(last_run.get("utc") or "")
-        dt = _parse_iso(utc_str)
-        running = bool(_notifier_pids())
-        seconds_since = None
-        if dt:
-            seconds_since = int((datetime.now(timezone.utc) - dt.astimezone(timezone.utc)).total_seconds())
-        if seconds_since is None:
-            seconds_left = poll_seconds if running else 0
-        else:
-            seconds_left = max(0, poll_seconds - (seconds_since % poll_seconds)) if running else 0
-        return HTTPStatus.OK, {
-            "ok": True,
-            "running": running,
-            "poll_seconds": poll_seconds,
-            "seconds_since_last_cycle": seconds_since,
-            "seconds_to_next_cycle": seconds_left,
-        }
-
     return HTTPStatus.NOT_FOUND, {"ok": False, "error": "Not found"}
 
 
 def _status_payload() -> dict:
-    state = load_state(STATE_FILE)
+    state = _read_state()
     last_run = state.get("last_run", {}) if isinstance(state.get("last_run", {}), dict) else {}
     delivery = last_run.get("delivery", {}) if isinstance(last_run.get("delivery", {}), dict) else {}
     lines = _tail(LOG_FILE, max_lines=1200)
@@ -668,7 +1017,7 @@ def _status_payload() -> dict:
     last_log_dt = _parse_log_time(last_log_line)
     age_sec = int((datetime.now() - last_log_dt).total_seconds()) if last_log_dt else None
     is_fresh = bool(age_sec is not None and age_sec <= max(15, poll_seconds * 2))
-    phase = _infer_phase(lines)
+    scan = _scan_log(lines, hours=1)
     last_run_utc = str(last_run.get("utc") or "")
     last_run_dt = _parse_iso(last_run_utc)
     since_last_cycle = None
@@ -680,25 +1029,25 @@ def _status_payload() -> dict:
     low_buffer_list = low_buffer if isinstance(low_buffer, list) else []
     night_buffer_list = night_buffer if isinstance(night_buffer, list) else []
     topics = _topic_buckets(low_buffer_list)
-    recent_errors = _recent_error_items(lines, limit=20)
+    recent_errors = scan["recent_errors"]
     last_error = recent_errors[0] if recent_errors else None
     return {
         "now": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         "process": {"running": bool(pids), "pids": pids},
-        "last_start": _last_line(lines, r"开始运行"),
-        "last_summary": _last_line(lines, r"summary tz="),
-        "last_push": _last_line(lines, r"已推送汇总消息|已推送:"),
-        "last_error": _last_line(lines, r"ERROR|WARNING"),
+        "last_start": scan["last_start"],
+        "last_summary": scan["last_summary"],
+        "last_push": scan["last_push"],
+        "last_error": scan["last_error"],
         "last_error_time": (last_error or {}).get("time", ""),
         "last_error_level": (last_error or {}).get("level", ""),
         "last_error_message": (last_error or {}).get("message", ""),
         "recent_errors": recent_errors,
         "activity": {
-            "phase": phase,
+            "phase": scan["phase"],
             "last_log_age_sec": age_sec,
             "fresh": is_fresh,
             "last_log_line": last_log_line,
-            "recent_events": _recent_events(lines),
+            "recent_events": scan["recent_events"],
             "poll_seconds": poll_seconds,
             "seconds_since_last_cycle": since_last_cycle,
             "seconds_to_next_cycle": next_cycle_sec,
@@ -720,53 +1069,120 @@ def _status_payload() -> dict:
             "alerts_sent": int(delivery.get("alerts_sent", 0)),
             "alerts_fail": int(delivery.get("alerts_fail", 0)),
         },
-        "delivery_1h": _rolling_delivery(lines, hours=1),
+        "delivery_1h": scan["delivery"],
+        "control": _control_status(),
     }
 
 
-def _push_topic(topic: str) -> dict:
-    _load_runtime_env()
-    token = (os.getenv("TELEGRAM_BOT_TOKEN") or "").strip()
-    chat_id = (os.getenv("TELEGRAM_CHAT_ID") or "").strip()
-    if not token or not chat_id:
-        return {"ok": False, "error": "Missing TELEGRAM_BOT_TOKEN or TELEGRAM_CHAT_ID"}
+_STATE_LOCK = threading.RLock()
+# The state this process last queued for writing; newer than the file until the write lands.
+_LATEST_STATE: dict | None = None
 
-    tz_name, news_tz = resolve_news_timezone()
-    now_local = datetime.now(tz=news_tz)
-    ai_api_key = (os.getenv("OPENAI_API_KEY") or "").strip()
-    ai_model = (os.getenv("AI_SUMMARY_MODEL") or "gpt-5-mini").strip()
-    ai_max_items = int(os.getenv("AI_SUMMARY_MAX_ITEMS", "30"))
 
-    state = load_state(STATE_FILE)
+def _load_state_for_update() -> dict:
+    # Caller holds _STATE_LOCK.
+    if _LATEST_STATE is not None and state_write_pending(STATE_FILE):
+        return _LATEST_STATE
+    return _validate_state(load_state(STATE_FILE))
+
+
+def _validate_state(state: dict) -> dict:
+    # Shape history_pushed once per load so the push path can assume a list of dicts.
+    history = state.get("history_pushed")
+    if not isinstance(history, list):
+        state["history_pushed"] = []
+    elif not all(isinstance(row, dict) for row in history):
+        state["history_pushed"] = [row for row in history if isinstance(row, dict)]
+    return state
+
+
+def _save_state_later(state: dict) -> None:
+    # Caller holds _STATE_LOCK. The shared writer snapshots the state and writes it off this thread.
+    global _LATEST_STATE
+    _LATEST_STATE = state
+    save_state_later(STATE_FILE, state)
+    # Status/timer payloads built from the old state are now stale.
+    _TTL_CACHE.clear()
+
+
+# Buffer keys of items a push is currently sending; other pushes skip them.
+_PUSHING_KEYS: set[str] = set()
+
+
+def _buffer_key(item: dict) -> str:
+    # The state may be reloaded between selection and bookkeeping, so match items by content.
+    return str(item.get("uid") or "") or encode_json(item.get("entry")).decode()
+
+
+def _select_for_push(topic: str) -> List[dict]:
+    # Caller holds _STATE_LOCK. Picks the buffered items for a topic and marks them in flight.
+    state = _load_state_for_update()
     low_buffer = state.get("low_score_buffer", [])
     night_buffer = state.get("night_buffer", [])
     if not isinstance(low_buffer, list):
-        return {"ok": False, "error": "Bad low_score_buffer state"}
+        raise ValueError("Bad low_score_buffer state")
     if not isinstance(night_buffer, list):
-        return {"ok": False, "error": "Bad night_buffer state"}
+        raise ValueError("Bad night_buffer state")
 
     selected: List[dict] = []
-    remaining_low: List[dict] = []
-    remaining_night: List[dict] = []
-
-    def _pick(items: List[dict], remain: List[dict], queue_name: str) -> None:
-        for item in items:
-            if not isinstance(item, dict):
-                continue
-            title = ((item.get("entry") or {}).get("title") or "").strip()
-            item_topic = detect_topic(title)
-            if topic == "__ALL__" or topic == item_topic:
-                one = dict(item)
-                one["_queue"] = queue_name
-                selected.append(one)
-            else:
-                remain.append(item)
+    seen_keys: set[str] = set()
+    for item in low_buffer + night_buffer:
+        if not isinstance(item, dict):
+            continue
+        title = ((item.get("entry") or {}).get("title") or "").strip()
+        if topic != "__ALL__" and topic != detect_topic(title):
+            continue
+        # The same story can sit in both buffers; push it once and drop the copy.
+        key = _buffer_key(item)
+        if key in seen_keys or key in _PUSHING_KEYS:
+            continue
+        seen_keys.add(key)
+        selected.append(item)
+    _PUSHING_KEYS.update(seen_keys)
+    return selected
+
+
+def _record_push(keys: set[str], pushed_rows: List[dict]) -> tuple[int, int]:
+    # Caller holds _STATE_LOCK. Drops the pushed items from the current buffers and logs the send.
+    state = _load_state_for_update()
+    remaining: Dict[str, List[dict]] = {}
+    for name in ("low_score_buffer", "night_buffer"):
+        items = state.get(name)
+        remaining[name] = [
+            x for x in (items if isinstance(items, list) else []) if isinstance(x, dict) and _buffer_key(x) not in keys
+        ]
+    state.update(remaining)
+    if pushed_rows:
+        history = state["history_pushed"]
+        history.extend(pushed_rows)
+        _prune_history(history, datetime.now(timezone.utc) - timedelta(days=7), 6000)
+    _save_state_later(state)
+    return len(remaining["low_score_buffer"]), len(remaining["night_buffer"])
 
-    _pick(low_buffer, remaining_low, "low_score_buffer")
-    _pick(night_buffer, remaining_night, "night_buffer")
 
+def _push_topic(topic: str) -> dict:
+    _load_runtime_env()
+    env = os.environ
+    token = env.get("TELEGRAM_BOT_TOKEN", "").strip()
+    chat_id = env.get("TELEGRAM_CHAT_ID", "").strip()
+    if not token or not chat_id:
+        return {"ok": False, "error": "Missing TELEGRAM_BOT_TOKEN or TELEGRAM_CHAT_ID"}
+
+    tz_name, news_tz = resolve_news_timezone()
+    now_local = datetime.now(tz=news_tz)
+    ai_api_key = env.get("OPENAI_API_KEY", "").strip()
+    ai_model = (env.get("AI_SUMMARY_MODEL") or "gpt-5-mini").strip()
+    ai_max_items = int(env.get("AI_SUMMARY_MAX_ITEMS", "30"))
+
+    # Only selection and bookkeeping hold the lock; the Telegram/OpenAI calls run without it.
+    with _STATE_LOCK:
+        try:
+            selected = _select_for_push(topic)
+        except ValueError as exc:
+            return {"ok": False, "error": str(exc)}
     if not selected:
         return {"ok": False, "error": f"No cached items for topic: {topic}"}
+    keys = {_buffer_key(x) for x in selected}
 
     compact_items = [
         {"source": x.get("source"), "entry": x.get("entry"), "uid": x.get("uid")}
@@ -775,6 +1191,8 @@ def _push_topic(topic: str) -> dict:
 
     sent = 0
     pushed_rows: List[dict] = []
+    # One manual push is one logical send; every history row shares its timestamp.
+    sent_at = _utc_ts_z()
     try:
         sent_compact = maybe_send_compact_summary(
             token=token,
@@ -791,7 +1209,7 @@ def _push_topic(topic: str) -> dict:
             sent = len(selected)
             pushed_rows.append(
                 {
-                    "ts": datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z"),
+                    "ts": sent_at,
                     "kind": "summary",
                     "status": "ok",
                     "count": len(selected),
@@ -801,59 +1219,59 @@ def _push_topic(topic: str) -> dict:
                 }
             )
         else:
+            row_head = {"ts": sent_at, "kind": "single", "status": "ok"}
             for item in selected:
+                source = item.get("source") or "Unknown"
+                entry = item.get("entry") or {}
                 send_news_item(
                     token=token,
                     chat_id=chat_id,
-                    source=item.get("source") or "Unknown",
-                    entry=item.get("entry") or {},
+                    source=source,
+                    entry=entry,
                     prefix="[Manual topic push] ",
                     fetch_article_image_enabled=True,
                 )
                 sent += 1
-                entry = item.get("entry") or {}
                 pushed_rows.append(
                     {
-                        "ts": datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z"),
-                        "kind": "single",
-                        "status": "ok",
-                        "source": item.get("source") or "Unknown",
+                        **row_head,
+                        "source": source,
                         "uid": item.get("uid") or "",
-                        "title": (entry.get("title") or "").strip(),
-                        "link": (entry.get("link") or "").strip(),
-                        "published": (entry.get("published") or "").strip(),
+                        "title": _stripped(entry, "title"),
+                        "link": _stripped(entry, "link"),
+                        "published": _stripped(entry, "published"),
                         "channel": "primary",
                         "manual": True,
                     }
                 )
     except Exception as exc:
+        with _STATE_LOCK:
+            _PUSHING_KEYS.difference_update(keys)
         return {"ok": False, "error": f"Push failed: {exc}"}
 
-    state["low_score_buffer"] = remaining_low
-    state["night_buffer"] = remaining_night
-    if pushed_rows:
-        history = state.get("history_pushed", [])
-        if not isinstance(history, list):
-            history = []
-        history.extend(pushed_rows)
-        cutoff = datetime.now(timezone.utc) - timedelta(days=7)
-        kept = []
-        for row in history:
-            dt = _parse_iso(str((row or {}).get("ts") or ""))
-            if dt and dt.astimezone(timezone.utc) < cutoff:
-                continue
-            kept.append(row)
-        state["history_pushed"] = kept[-6000:]
-    save_state(STATE_FILE, state)
+    with _STATE_LOCK:
+        _PUSHING_KEYS.difference_update(keys)
+        remaining_low, remaining_night = _record_push(keys, pushed_rows)
     return {
         "ok": True,
         "sent": sent,
         "topic": topic,
-        "remaining_low_buffer": len(remaining_low),
-        "remaining_night_buffer": len(remaining_night),
+        "remaining_low_buffer": remaining_low,
+        "remaining_night_buffer": remaining_night,
     }
 
 
+_MAX_BODY_BYTES = 1 << 20
+_STREAM_MIN_ROWS = 200
+_STREAM_BATCH_ROWS = 100
+_CORS_HEADERS = (
+    ("Access-Control-Allow-Origin", "*"),
+    ("Access-Control-Allow-Methods", "GET, POST, PUT, OPTIONS"),
+    ("Access-Control-Allow-Headers", "Content-Type"),
+)
+_JSON_HEADERS = (("Content-Type", "application/json; charset=utf-8"),) + _CORS_HEADERS
+
+
 ROOT_INFO = {
     "ok": True,
     "service": "news-pusher-monitor-api",
@@ -877,108 +1295,230 @@ ROOT_INFO = {
 }
 
 
+_ROOT_INFO_BYTES = encode_json(ROOT_INFO)
+
+
 
 
 class Handler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps dashboard poll connections open; every response carries a
+    # Content-Length. Idle keep-alive sockets give their worker back after timeout.
+    protocol_version = "HTTP/1.1"
+    timeout = 5
+
     def log_message(self, _format: str, *args: Any) -> None:  # reduce noisy logs
         return
 
     def _json(self, code: int, payload: dict) -> None:
-        raw = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self._json_bytes(code, encode_json(payload))
+
+    def _json_bytes(self, code: int, raw: bytes) -> None:
         self.send_response(code)
-        self.send_header("Content-Type", "application/json; charset=utf-8")
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, POST, PUT, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self._send_headers(_JSON_HEADERS)
         self.send_header("Content-Length", str(len(raw)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
         self.end_headers()
         self.wfile.write(raw)
 
+    def _json_stream(self, code: int, payload: dict) -> None:
+        # Chunked body: the envelope first, then "items" encoded a batch at a time, so
+        # large detail lists start flowing before the whole array is serialized.
+        items = payload["items"]
+        head = {k: v for k, v in payload.items() if k != "items"}
+        self.send_response(code)
+        self._send_headers(_JSON_HEADERS)
+        self.send_header("Transfer-Encoding", "chunked")
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        prefix = encode_json(head)[:-1] + (b',"items":[' if head else b'"items":[')
+        self._write_chunk(prefix)
+        for i in range(0, len(items), _STREAM_BATCH_ROWS):
+            part = encode_json(items[i : i + _STREAM_BATCH_ROWS])[1:-1]
+            self._write_chunk(part if i == 0 else b"," + part)
+        self._write_chunk(b"]}")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _write_chunk(self, data: bytes) -> None:
+        if data:
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+    def _send_headers(self, headers: tuple[tuple[str, str], ...]) -> None:
+        for name, value in headers:
+            self.send_header(name, value)
+
+    def _close_if_body_unread(self) -> None:
+        # On a keep-alive connection, body bytes nobody reads would be parsed as the next request.
+        if self.headers.get("Transfer-Encoding") or (self.headers.get("Content-Length") or "0").strip() != "0":
+            self.close_connection = True
+
     def do_OPTIONS(self) -> None:
+        self._close_if_body_unread()
         self.send_response(HTTPStatus.NO_CONTENT)
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, POST, PUT, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self._send_headers(_CORS_HEADERS)
+        self.send_header("Content-Length", "0")
         self.end_headers()
 
-    def do_GET(self) -> None:
-        parsed = urlparse(self.path)
-        path = parsed.path
-        if path == "/" or path.startswith("/index.html"):
-            self._json(HTTPStatus.OK, ROOT_INFO)
-            return
-        if path == "/api/status":
-            self._json(HTTPStatus.OK, _status_payload())
-            return
-        if path == "/api/tags":
-            payload = _load_tags_payload()
-            payload["ok"] = True
-            self._json(HTTPStatus.OK, payload)
-            return
-        if path.startswith("/api/details/") or path == "/api/engine/timer":
-            code, payload = _details_payload(self.path)
-            self._json(code, payload)
-            return
-        self._json(HTTPStatus.NOT_FOUND, {"ok": False, "error": "Not found"})
+    def _get_root(self) -> None:
+        self._json_bytes(HTTPStatus.OK, _ROOT_INFO_BYTES)
 
-    def do_POST(self) -> None:
-        if self.path not in ("/api/push-topic", "/api/control-notifier"):
-            self._json(HTTPStatus.NOT_FOUND, {"ok": False, "error": "Not found"})
-            return
-        try:
-            n = int(self.headers.get("Content-Length", "0"))
-            raw = self.rfile.read(n) if n > 0 else b"{}"
-            data = json.loads(raw.decode("utf-8"))
-        except Exception:
-            self._json(HTTPStatus.BAD_REQUEST, {"ok": False, "error": "Bad JSON"})
+    # Polled endpoints cache the encoded body, so TTL hits skip the encoder as well.
+    def _get_status(self) -> None:
+        self._json_bytes(HTTPStatus.OK, _ttl_cached("status", lambda: encode_json(_status_payload())))
+
+    def _get_engine_timer(self) -> None:
+        self._json_bytes(HTTPStatus.OK, _ttl_cached("engine_timer", lambda: encode_json(_engine_timer_payload())))
+
+    def _get_tags(self) -> None:
+        payload = _load_tags_payload()
+        payload["ok"] = True
+        self._json(HTTPStatus.OK, payload)
+
+    def _get_details(self) -> None:
+        code, payload = _details_payload(self.path)
+        items = payload.get("items")
+        if self.request_version == "HTTP/1.1" and isinstance(items, list) and len(items) > _STREAM_MIN_ROWS:
+            self._json_stream(code, payload)
             return
-        if self.path == "/api/push-topic":
-            topic = str(data.get("topic") or "").strip()
-            if not topic:
-                self._json(HTTPStatus.BAD_REQUEST, {"ok": False, "error": "Missing topic"})
+        self._json(code, payload)
+
+    # Exact paths resolve with one dict lookup; only the two prefix families fall through.
+    _GET_ROUTES: Dict[str, Callable[[Handler], None]] = {
+        "/": _get_root,
+        "/api/status": _get_status,
+        "/api/tags": _get_tags,
+        "/api/engine/timer": _get_engine_timer,
+    }
+    _GET_PREFIX_ROUTES: tuple[tuple[str, Callable[[Handler], None]], ...] = (
+        ("/api/details/", _get_details),
+        ("/index.html", _get_root),
+    )
+
+    def do_GET(self) -> None:
+        self._close_if_body_unread()
+        path = urlparse(self.path).path
+        handler = self._GET_ROUTES.get(path)
+        if handler is None:
+            for prefix, prefix_handler in self._GET_PREFIX_ROUTES:
+                if path.startswith(prefix):
+                    handler = prefix_handler
+                    break
+            else:
+                self._json(HTTPStatus.NOT_FOUND, {"ok": False, "error": "Not found"})
                 return
-            result = _push_topic(topic)
-            self._json(HTTPStatus.OK if result.get("ok") else HTTPStatus.BAD_REQUEST, result)
+        handler(self)
+
+    def _sync_requested(self, data: Any) -> bool:
+        # Scripts can opt back into blocking control with ?sync=1 or {"sync": true}.
+        qs = parse_qs(urlparse(self.path).query or "")
+        flag = (qs.get("sync") or [""])[0].strip().lower() in ("1", "true", "yes")
+        return flag or (isinstance(data, dict) and data.get("sync") is True)
+
+    def _post_push_topic(self, data: Any) -> None:
+        topic = str(data.get("topic") or "").strip()
+        if not topic:
+            self._json(HTTPStatus.BAD_REQUEST, {"ok": False, "error": "Missing topic"})
             return
+        result = _push_topic(topic)
+        self._json(HTTPStatus.OK if result.get("ok") else HTTPStatus.BAD_REQUEST, result)
 
+    def _post_control(self, data: Any) -> None:
         action = str(data.get("action") or "").strip().lower()
         if action not in ("start", "stop", "restart"):
             self._json(HTTPStatus.BAD_REQUEST, {"ok": False, "error": "Missing/invalid action"})
             return
-        result = _control_notifier(action)
+        result = _control_notifier(action) if self._sync_requested(data) else _queue_control(action)
         self._json(HTTPStatus.OK if result.get("ok") else HTTPStatus.BAD_REQUEST, result)
 
-    def do_PUT(self) -> None:
-        if self.path != "/api/tags":
+    def _put_tags(self, data: Any) -> None:
+        result = _save_tags_payload(data if isinstance(data, dict) else {}, sync=self._sync_requested(data))
+        self._json(HTTPStatus.OK if result.get("ok") else HTTPStatus.BAD_REQUEST, result)
+
+    _POST_ROUTES: Dict[str, Callable[[Handler, Any], None]] = {
+        "/api/push-topic": _post_push_topic,
+        "/api/control-notifier": _post_control,
+    }
+    _PUT_ROUTES: Dict[str, Callable[[Handler, Any], None]] = {
+        "/api/tags": _put_tags,
+    }
+
+    def _dispatch_with_body(self, routes: Dict[str, Callable[[Handler, Any], None]]) -> None:
+        handler = routes.get(urlparse(self.path).path)
+        if handler is None:
+            self.close_connection = True
             self._json(HTTPStatus.NOT_FOUND, {"ok": False, "error": "Not found"})
             return
+        if self.headers.get("Transfer-Encoding"):
+            # Only Content-Length bodies are read; a chunked body would be left on the socket.
+            self.close_connection = True
         try:
             n = int(self.headers.get("Content-Length", "0"))
-            raw = self.rfile.read(n) if n > 0 else b"{}"
-            data = json.loads(raw.decode("utf-8"))
+            if n < 0:
+                raise ValueError("negative Content-Length")
+            if n > _MAX_BODY_BYTES:
+                self.close_connection = True
+                self._json(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"ok": False, "error": "Body too large"})
+                return
+            data = json.loads(self.rfile.read(n) if n > 0 else b"{}")
         except Exception:
+            # The body may not have been consumed; don't reuse the connection.
+            self.close_connection = True
             self._json(HTTPStatus.BAD_REQUEST, {"ok": False, "error": "Bad JSON"})
             return
-        result = _save_tags_payload(data if isinstance(data, dict) else {})
-        self._json(HTTPStatus.OK if result.get("ok") else HTTPStatus.BAD_REQUEST, result)
+        handler(self, data)
+
+    def do_POST(self) -> None:
+        self._dispatch_with_body(self._POST_ROUTES)
+
+    def do_PUT(self) -> None:
+        self._dispatch_with_body(self._PUT_ROUTES)
 
 
-class ReusableThreadingHTTPServer(ThreadingHTTPServer):
+class PooledHTTPServer(HTTPServer):
+    # Same dispatch as ThreadingMixIn, but on a fixed set of reused worker threads.
     allow_reuse_address = True
+    # The larger backlog absorbs dashboard poll bursts while workers are busy.
+    request_queue_size = 128
+
+    def __init__(self, server_address: tuple[str, int], handler_class: type, max_workers: int = 32) -> None:
+        # Created first: a failed bind calls server_close(), which shuts the pool down.
+        self.pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="monitor-ui")
+        super().__init__(server_address, handler_class)
+
+    def process_request_thread(self, request: Any, client_address: Any) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        self.pool.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.pool.shutdown(wait=False, cancel_futures=True)
 
 
 def main() -> None:
     _load_runtime_env()
     host = os.getenv("MONITOR_UI_HOST", "127.0.0.1").strip() or "127.0.0.1"
     port = int(os.getenv("MONITOR_UI_PORT", "8787"))
-    srv = ReusableThreadingHTTPServer((host, port), Handler)
+    # I/O-bound handlers plus keep-alive pollers: scale with cores, never below 32.
+    workers = int(os.getenv("UI_WORKERS", "").strip() or max(32, (os.cpu_count() or 1) * 4))
+    srv = PooledHTTPServer((host, port), Handler, max_workers=workers)
     print(f"monitor ui running on http://{host}:{port}")
+    # SIGTERM unwinds like Ctrl-C so pending state still reaches disk.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
     try:
         srv.serve_forever()
     except KeyboardInterrupt:
         pass
     finally:
         srv.server_close()
+        flush_state_writes()
 
 
 if __name__ == "__main__":
@@ -5,17 +5,30 @@ import argparse
 import json
 import logging
 import os
+import random
 import re
+import select
+import signal
 import subprocess
+import sys
+import threading
 import time
 import html
 import email.utils
+import heapq
+import http.client
+import io
+import urllib.error
 import urllib.parse
 import urllib.request
 import xml.etree.ElementTree as ET
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone, tzinfo
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Tuple
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Tuple
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 SOURCE_DOMAINS = {
@@ -207,6 +220,10 @@ DEFAULT_MAJOR_KEYWORDS = [
     "共同富裕",
 ]
 
+BROWSER_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
 DEFAULT_FALLBACK_IMAGE = "https://upload.wikimedia.org/wikipedia/commons/thumb/a/ac/No_image_available.svg/512px-No_image_available.svg.png"
 DEFAULT_ENV_FILE = ".env.stable"
 PROFILE_PREFIX = "STABLE"
@@ -327,29 +344,87 @@ HEAT_SIGNAL_WEIGHTS = [
     (("ai", "chip", "semiconductor"), 1.6),
 ]
 
+# Compiled once at import; these run per entry / per title.
+_RX_CJK = re.compile(r"[\u4e00-\u9fff]")
+_RX_LATIN = re.compile(r"[A-Za-z]")
+_RX_BIG_NUMBER = re.compile(r"\b\d{3,}\b")
+_RX_HTML_TAG = re.compile(r"<[^>]+>")
+_RX_GOOGLE_IMG_S0 = re.compile(r"=s0-w\d+(-rw)?")
+_RX_GOOGLE_IMG_WH = re.compile(r"=w\d+-h\d+(-p)?")
+# Page image hints in priority order, each with a literal its pattern cannot
+# match without, so hints absent from the page are skipped without a regex scan.
+_RX_PAGE_IMAGES = tuple(
+    (marker, re.compile(p, re.IGNORECASE))
+    for marker, p in (
+        ("og:image", r'<meta[^>]+property=["\']og:image["\'][^>]+content=["\']([^"\']+)["\']'),
+        ("og:image", r'<meta[^>]+content=["\']([^"\']+)["\'][^>]+property=["\']og:image["\']'),
+        ("twitter:image", r'<meta[^>]+name=["\']twitter:image["\'][^>]+content=["\']([^"\']+)["\']'),
+        ("twitter:image", r'<meta[^>]+content=["\']([^"\']+)["\'][^>]+name=["\']twitter:image["\']'),
+        ("image_src", r'<link[^>]+rel=["\']image_src["\'][^>]+href=["\']([^"\']+)["\']'),
+        ("<img", r'<img[^>]+src=["\']([^"\']+)["\']'),
+    )
+)
+
+
+# re.IGNORECASE treats these as ASCII letters; str.lower() does not.
+_ASCII_CASE_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s"})
 
-def _topic_keyword_hit(title: str, kw: str) -> bool:
-    title = (title or "").strip()
-    kw = (kw or "").strip()
-    if not title or not kw:
-        return False
-    if kw.isascii():
-        part = r"[\s\-]+".join(re.escape(p) for p in kw.split())
-        return re.search(r"(?<![A-Za-z0-9_])" + part + r"(?![A-Za-z0-9_])", title, re.IGNORECASE) is not None
-    return kw in title
+
+def fold_title(text: str) -> str:
+    return text.lower() if text.isascii() else text.translate(_ASCII_CASE_FOLD).lower()
+
+
+class KeywordMatcher:
+    # A whole keyword list compiled into at most two alternations, so a title is scanned
+    # once instead of once per keyword. ASCII keywords match whole words / phrases only
+    # (fed != federal), hyphens may join phrase words ("White-House"), and they are
+    # matched case-sensitively against the folded title, which is much cheaper than
+    # re.IGNORECASE. Other keywords (e.g. CJK, where titles have no spaces) are substrings.
+    __slots__ = ("ascii", "other")
+
+    def __init__(self, keywords: List[str], fold_non_ascii: bool) -> None:
+        ascii_parts: List[str] = []
+        other_parts: List[str] = []
+        for kw in keywords:
+            kw = (kw or "").strip()
+            if not kw:
+                continue
+            if kw.isascii():
+                ascii_parts.append(r"[\s\-]+".join(re.escape(p) for p in kw.lower().split()))
+            else:
+                other_parts.append(re.escape(kw))
+        self.ascii = None
+        self.other = None
+        if ascii_parts:
+            self.ascii = re.compile(r"(?<![a-z0-9_])(?:" + "|".join(ascii_parts) + r")(?![a-z0-9_])")
+        if other_parts:
+            self.other = re.compile("|".join(other_parts), re.IGNORECASE if fold_non_ascii else 0)
+
+    def __bool__(self) -> bool:
+        return self.ascii is not None or self.other is not None
+
+    def matches(self, text: str, folded: str) -> bool:
+        # folded must be fold_title(text).
+        if self.ascii is not None and self.ascii.search(folded):
+            return True
+        return self.other is not None and self.other.search(text) is not None
+
+    def search(self, text: str) -> bool:
+        return self.matches(text, fold_title(text))
 
 
 def _parse_csv_keywords(raw: str) -> List[str]:
-    out: List[str] = []
-    for tok in (raw or "").split(","):
-        x = tok.strip()
-        if x and x not in out:
-            out.append(x)
-    return out
+    # Ordered dedupe: dict keys keep first-seen order.
+    return list(dict.fromkeys(x for tok in (raw or "").split(",") if (x := tok.strip())))
 
 
 def get_summary_topic_rules() -> List[Tuple[str, List[str]]]:
-    raw = (os.getenv("TOPIC_RULES_JSON") or "").strip()
+    return _summary_topic_rules((os.getenv("TOPIC_RULES_JSON") or "").strip())
+
+
+@lru_cache(maxsize=8)
+def _summary_topic_rules(raw: str) -> List[Tuple[str, List[str]]]:
+    # Parsed once per distinct TOPIC_RULES_JSON value; callers must not mutate the result.
     if raw:
         try:
             data = json.loads(raw)
@@ -362,11 +437,7 @@ def get_summary_topic_rules() -> List[Tuple[str, List[str]]]:
                     tags = item.get("tags")
                     if not name or not isinstance(tags, list):
                         continue
-                    cleaned = []
-                    for t in tags:
-                        s = str(t or "").strip()
-                        if s and s not in cleaned:
-                            cleaned.append(s)
+                    cleaned = list(dict.fromkeys(s for t in tags if (s := str(t or "").strip())))
                     if cleaned:
                         out.append((name, cleaned))
             if out:
@@ -377,20 +448,46 @@ def get_summary_topic_rules() -> List[Tuple[str, List[str]]]:
 
 
 def get_iran_keywords() -> List[str]:
-    raw = (os.getenv("IRAN_RELATED_KEYWORDS") or "").strip()
+    return _iran_keywords((os.getenv("IRAN_RELATED_KEYWORDS") or "").strip())
+
+
+@lru_cache(maxsize=8)
+def _iran_keywords(raw: str) -> List[str]:
     kws = _parse_csv_keywords(raw)
     return kws if kws else list(DEFAULT_IRAN_KEYWORDS)
 
 
+@lru_cache(maxsize=8)
+def _topic_matchers(raw: str) -> List[Tuple[str, re.Pattern | None, re.Pattern | None]]:
+    # (label, ASCII pattern for the folded title, pattern for the raw title) per rule.
+    out: List[Tuple[str, re.Pattern | None, re.Pattern | None]] = []
+    for label, kws in _summary_topic_rules(raw):
+        matcher = KeywordMatcher(kws, fold_non_ascii=False)
+        if matcher:
+            out.append((label, matcher.ascii, matcher.other))
+    return out
+
+
 def detect_topic(title: str) -> str:
-    for label, kws in get_summary_topic_rules():
-        if any(_topic_keyword_hit(title, k) for k in kws):
+    title = (title or "").strip()
+    if not title:
+        return "其他动态"
+    return _detect_topic(title, (os.getenv("TOPIC_RULES_JSON") or "").strip())
+
+
+# The same titles are classified by the run loop, the digests and every dashboard
+# request; key on the rules too so edited TOPIC_RULES_JSON takes effect.
+@lru_cache(maxsize=4096)
+def _detect_topic(title: str, raw_rules: str) -> str:
+    folded = fold_title(title)
+    for label, ascii_rx, other_rx in _topic_matchers(raw_rules):
+        if (ascii_rx is not None and ascii_rx.search(folded)) or (other_rx is not None and other_rx.search(title)):
             return label
     return "其他动态"
 
 
-def is_iran_related(entry: dict) -> bool:
-    title = (entry.get("title") or "").strip().lower()
+def is_iran_related(entry: dict, lower_title: str | None = None) -> bool:
+    title = (entry.get("title") or "").strip().lower() if lower_title is None else lower_title
     if not title:
         return False
     iran_kws = get_iran_keywords()
@@ -398,18 +495,33 @@ def is_iran_related(entry: dict) -> bool:
 
 
 def detect_entry_language(entry: dict) -> str:
-    title = (entry.get("title") or "").strip()
+    return _title_language((entry.get("title") or "").strip())
+
+
+# Every fetched entry is classified each poll, seen or not; feeds repeat titles.
+@lru_cache(maxsize=4096)
+def _title_language(title: str) -> str:
     if not title:
         return "other"
-    if re.search(r"[\u4e00-\u9fff]", title):
+    # Most titles are plain English: isascii() is a C-level check that rules out CJK.
+    if not title.isascii() and _RX_CJK.search(title):
         return "zh"
-    if re.search(r"[A-Za-z]", title):
+    if _RX_LATIN.search(title):
         return "en"
     return "other"
 
 
+_EPOCH_UTC = datetime.fromtimestamp(0, tz=timezone.utc)
+
+
 def parse_published_ts(entry: dict) -> datetime | None:
-    raw = (entry.get("published") or "").strip()
+    return _parse_published_raw((entry.get("published") or "").strip())
+
+
+# Keyed on the raw date string: the same entries are re-parsed by filtering, heat
+# scoring and captions, and again on every poll while they stay in the feed.
+@lru_cache(maxsize=4096)
+def _parse_published_raw(raw: str) -> datetime | None:
     if not raw:
         return None
     try:
@@ -428,19 +540,26 @@ def parse_published_ts(entry: dict) -> datetime | None:
         return None
 
 
-def compute_news_heat(source: str, entry: dict, now_local: datetime | None = None) -> float:
-    title = (entry.get("title") or "").strip().lower()
+def compute_news_heat(
+    source: str,
+    entry: dict,
+    now_local: datetime | None = None,
+    published_dt: datetime | None = None,
+    lower_title: str | None = None,
+) -> float:
+    # published_dt / lower_title let callers that already derived them skip redoing it.
+    title = (entry.get("title") or "").strip().lower() if lower_title is None else lower_title
     score = SOURCE_HEAT_WEIGHT.get(source, 1.5)
-
     for kws, w in HEAT_SIGNAL_WEIGHTS:
-        hit = sum(1 for kw in kws if kw in title)
+        hit = sum(kw in title for kw in kws)
         if hit:
             score += w + (hit - 1) * 0.4
 
-    if re.search(r"\b\d{3,}\b", title):
+    if _RX_BIG_NUMBER.search(title):
         score += 0.8
 
-    published_dt = parse_published_ts(entry)
+    if published_dt is None:
+        published_dt = parse_published_ts(entry)
     if published_dt:
         now_utc = (now_local or datetime.now(timezone.utc)).astimezone(timezone.utc)
         age_hours = max(0.0, (now_utc - published_dt).total_seconds() / 3600)
@@ -455,7 +574,12 @@ def compute_news_heat(source: str, entry: dict, now_local: datetime | None = Non
 
 
 def resolve_news_timezone() -> tuple[str, tzinfo]:
-    tz_name = (os.getenv("NEWS_TZ") or os.getenv("TZ") or "").strip()
+    return _resolve_timezone((os.getenv("NEWS_TZ") or os.getenv("TZ") or "").strip())
+
+
+@lru_cache(maxsize=8)
+def _resolve_timezone(tz_name: str) -> tuple[str, tzinfo]:
+    # Keyed on the raw NEWS_TZ/TZ value so an edited env file still takes effect.
     if tz_name:
         try:
             return tz_name, ZoneInfo(tz_name)
@@ -466,6 +590,8 @@ def resolve_news_timezone() -> tuple[str, tzinfo]:
     return "UTC", timezone.utc
 
 
+# Source/domain URL helpers are pure over the static tables above: memoize them.
+@lru_cache(maxsize=None)
 def source_logo_url(source: str) -> str:
     domain = SOURCE_DOMAINS.get(source, "")
     if not domain:
@@ -473,28 +599,31 @@ def source_logo_url(source: str) -> str:
     return f"https://www.google.com/s2/favicons?domain={domain}&sz=256"
 
 
-def source_logo_candidates(source: str) -> List[str]:
+@lru_cache(maxsize=None)
+def source_logo_candidates(source: str) -> Tuple[str, ...]:
     domain = SOURCE_DOMAINS.get(source, "")
     if not domain:
-        return []
-    return [
+        return ()
+    return (
         f"https://logo.clearbit.com/{domain}",
         source_logo_url(source),
-    ]
+    )
 
 
 def extract_image_from_html(page_url: str, html_text: str) -> str:
-    patterns = [
-        r'<meta[^>]+property=["\']og:image["\'][^>]+content=["\']([^"\']+)["\']',
-        r'<meta[^>]+content=["\']([^"\']+)["\'][^>]+property=["\']og:image["\']',
-        r'<meta[^>]+name=["\']twitter:image["\'][^>]+content=["\']([^"\']+)["\']',
-        r'<meta[^>]+content=["\']([^"\']+)["\'][^>]+name=["\']twitter:image["\']',
-        r'<link[^>]+rel=["\']image_src["\'][^>]+href=["\']([^"\']+)["\']',
-        r'<img[^>]+src=["\']([^"\']+)["\']',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, html_text, flags=re.IGNORECASE)
+    # Most pages hit the first pattern, so lower() is only paid once one misses; after that,
+    # patterns whose marker is absent are skipped. lower() misses the letters re.IGNORECASE
+    # folds onto ASCII (translating the whole page would cost more than the regexes), so a
+    # page containing one of those skips the prefilter.
+    lowered = ""
+    prefilter = html_text.isascii() or not any(chr(ch) in html_text for ch in _ASCII_CASE_FOLD)
+    for marker, pattern in _RX_PAGE_IMAGES:
+        if lowered and marker not in lowered:
+            continue
+        match = pattern.search(html_text)
         if not match:
+            if prefilter and not lowered:
+                lowered = html_text.lower()
             continue
         url = html.unescape(match.group(1)).strip()
         if not url:
@@ -506,14 +635,7 @@ def extract_image_from_html(page_url: str, html_text: str) -> str:
 def fetch_article_image(article_url: str, timeout: int = 20) -> str:
     if not article_url:
         return ""
-    req = urllib.request.Request(
-        article_url,
-        headers={
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        },
-    )
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
+    with http_open(article_url, headers={"User-Agent": BROWSER_USER_AGENT}, timeout=timeout) as resp:
         final_url = resp.geturl() or article_url
         content_type = (resp.headers.get("Content-Type") or "").lower()
         if "text/html" not in content_type and "application/xhtml+xml" not in content_type:
@@ -526,6 +648,33 @@ def fetch_article_image(article_url: str, timeout: int = 20) -> str:
     return extract_image_from_html(final_url, text)
 
 
+ARTICLE_IMAGE_CONCURRENCY = 16
+
+
+def _article_image_or_empty(source: str, link: str) -> str:
+    try:
+        return normalize_image_url(fetch_article_image(link))
+    except Exception:
+        logging.exception("抓取正文配图失败，source=%s", source)
+        return ""
+
+
+# Long-lived so its workers keep article-host connections alive between batches.
+_ARTICLE_IMAGE_POOL = ThreadPoolExecutor(max_workers=ARTICLE_IMAGE_CONCURRENCY, thread_name_prefix="article-image")
+
+
+def prefetch_article_images(items: List[Tuple[str, dict]]) -> Dict[str, Future]:
+    # Starts fetching every item's article image in the background and returns
+    # article link -> future of the normalized image URL. Each send waits only for
+    # its own image, so later fetches overlap earlier Telegram sends.
+    futures: Dict[str, Future] = {}
+    for source, entry in items:
+        link = (entry.get("link") or "").strip()
+        if link and link not in futures:
+            futures[link] = _ARTICLE_IMAGE_POOL.submit(_article_image_or_empty, source, link)
+    return futures
+
+
 def load_dotenv_simple(path: str = ".env") -> None:
     env_file = Path(path)
     if not env_file.exists():
@@ -557,42 +706,49 @@ def apply_profile_credentials(prefix: str) -> None:
             os.environ[dest] = v
 
 
+@lru_cache(maxsize=None)
 def google_news_rss_url(domain: str) -> str:
     q = urllib.parse.quote_plus(f"site:{domain}")
     return f"https://news.google.com/rss/search?q={q}&hl=en-US&gl=US&ceid=US:en"
 
 
+@lru_cache(maxsize=None)
 def bing_news_rss_url(domain: str) -> str:
     q = urllib.parse.quote_plus(f"site:{domain}")
     return f"https://www.bing.com/news/search?q={q}&format=rss"
 
 
-def build_source_feeds() -> Dict[str, str]:
+@lru_cache(maxsize=1)
+def build_source_feeds() -> Mapping[str, str]:
+    # Built once; read-only so callers cannot corrupt the shared copy.
     out = dict(SOURCE_FEEDS)
     for name, domain in SOURCE_DOMAINS.items():
         out.setdefault(name, google_news_rss_url(domain))
-    return out
+    return MappingProxyType(out)
 
 
 def source_feed_candidates(source: str, primary_url: str) -> List[str]:
-    urls: List[str] = []
-    if primary_url:
-        urls.append(primary_url)
-    for u in SOURCE_FALLBACK_FEEDS.get(source, []):
-        if u and u not in urls:
-            urls.append(u)
+    urls = [primary_url, *SOURCE_FALLBACK_FEEDS.get(source, [])]
     domain = SOURCE_DOMAINS.get(source, "")
     if domain:
-        for u in (bing_news_rss_url(domain), google_news_rss_url(domain)):
-            if u and u not in urls:
-                urls.append(u)
-    return urls
+        urls += [bing_news_rss_url(domain), google_news_rss_url(domain)]
+    return list(dict.fromkeys(u for u in urls if u))
 
 
 def now_ts() -> int:
     return int(time.time())
 
 
+def sleep_until_next_tick(next_tick: float, period: float) -> float:
+    # Keep a fixed cadence: a slow cycle shortens the next sleep; an overrun resyncs instead of bursting.
+    next_tick += period
+    delay = next_tick - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+        return next_tick
+    return time.monotonic()
+
+
 def load_state(state_file: Path) -> dict:
     if not state_file.exists():
         return {
@@ -626,6 +782,13 @@ def load_state(state_file: Path) -> dict:
     state.setdefault("low_score_buffer", [])
     state.setdefault("last_low_digest_slot", "")
     state.setdefault("last_run", {})
+    # Callers rely on these shapes, so a hand-edited or truncated file is normalised here once.
+    if not isinstance(state.get("seen"), dict):
+        state["seen"] = {}
+    if not isinstance(state.get("night_buffer"), list):
+        state["night_buffer"] = []
+    if not isinstance(state.get("low_score_buffer"), list):
+        state["low_score_buffer"] = []
     if not isinstance(state.get("last_run"), dict):
         state["last_run"] = {}
     return state
@@ -638,6 +801,16 @@ def try_git(args: List[str]) -> str:
         return ""
 
 
+@lru_cache(maxsize=1)
+def checkout_info() -> tuple[str, str]:
+    # The checkout cannot change under a running process; the first answer describes the loaded code.
+    sha = try_git(["git", "rev-parse", "HEAD"])
+    ref = try_git(["git", "rev-parse", "--abbrev-ref", "HEAD"])
+    if ref == "HEAD":
+        ref = ""
+    return sha, ref
+
+
 def github_run_url() -> str:
     server = (os.getenv("GITHUB_SERVER_URL") or "").strip()
     repo = (os.getenv("GITHUB_REPOSITORY") or "").strip()
@@ -647,86 +820,247 @@ def github_run_url() -> str:
     return ""
 
 
-def save_state(state_file: Path, state: dict) -> None:
+def _write_state_text(state_file: Path, text: str) -> None:
     tmp_file = state_file.with_suffix(".tmp")
     with tmp_file.open("w", encoding="utf-8") as f:
-        json.dump(state, f, ensure_ascii=False, indent=2)
+        f.write(text)
     tmp_file.replace(state_file)
 
 
-def prune_seen(seen: dict, ttl_hours: int) -> dict:
-    cutoff = now_ts() - ttl_hours * 3600
-    return {k: v for k, v in seen.items() if isinstance(v, int) and v >= cutoff}
+def save_state(state_file: Path, state: dict) -> None:
+    _write_state_text(state_file, json.dumps(state, ensure_ascii=False, indent=2))
 
 
-def http_get_bytes(url: str, timeout: int = 20) -> bytes:
-    req = urllib.request.Request(
-        url,
-        headers={
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        },
-    )
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        return resp.read()
+_STATE_WRITE_LOCK = threading.Lock()
+_STATE_WRITE_DIRTY = threading.Event()
+_STATE_WRITE_RETRY = 5.0
+_STATE_WRITE_LOG_EVERY = 300.0
+_PENDING_STATE_WRITES: Dict[Path, str] = {}
+_STATE_WRITER: threading.Thread | None = None
+
+
+def save_state_later(state_file: Path, state: dict) -> None:
+    # Snapshot now (the caller keeps mutating state); only the file write moves off the caller's thread.
+    global _STATE_WRITER
+    text = json.dumps(state, ensure_ascii=False, indent=2)
+    with _STATE_WRITE_LOCK:
+        _PENDING_STATE_WRITES[state_file] = text
+        _STATE_WRITE_DIRTY.set()
+        if _STATE_WRITER is None:
+            _STATE_WRITER = threading.Thread(target=_state_writer_loop, name="state-writer", daemon=True)
+            _STATE_WRITER.start()
+
+
+def state_write_pending(state_file: Path) -> bool:
+    with _STATE_WRITE_LOCK:
+        return state_file in _PENDING_STATE_WRITES
+
+
+def flush_state_writes() -> None:
+    with _STATE_WRITE_LOCK:
+        _STATE_WRITE_DIRTY.clear()
+        for state_file in list(_PENDING_STATE_WRITES):
+            _write_state_text(state_file, _PENDING_STATE_WRITES[state_file])
+            del _PENDING_STATE_WRITES[state_file]
+
+
+def _state_writer_loop() -> None:
+    # A failed write stays pending and is retried; while it keeps failing, log at most every few minutes.
+    last_logged = float("-inf")
+    while True:
+        _STATE_WRITE_DIRTY.wait()
+        try:
+            flush_state_writes()
+        except Exception:
+            now = time.monotonic()
+            if now - last_logged >= _STATE_WRITE_LOG_EVERY:
+                last_logged = now
+                logging.exception("写入状态文件失败，%.0f 秒后重试", _STATE_WRITE_RETRY)
+            _STATE_WRITE_DIRTY.set()
+            time.sleep(_STATE_WRITE_RETRY)
+
+
+def prune_seen(seen: dict, ttl_hours: int) -> dict:
+    # Prunes in place: the dict holds every uid seen within the TTL, so don't copy it each cycle.
+    cutoff = now_ts() - ttl_hours * 3600
+    for k in [k for k, v in seen.items() if not (isinstance(v, int) and v >= cutoff)]:
+        del seen[k]
+    return seen
+
+
+_HTTP_LOCAL = threading.local()
+_HTTP_REDIRECTS = (301, 302, 303, 307, 308)
+_HTTP_MAX_REDIRECTS = 10
+# Per-thread cap and idle limit, so one-off article/image hosts don't pin sockets forever.
+_HTTP_MAX_IDLE_CONNS = 8
+_HTTP_IDLE_SECONDS = 60.0
+
+
+class _PooledResponse:
+    # The slice of the urlopen() response API used here, over a keep-alive connection.
+    def __init__(self, conn: http.client.HTTPConnection, resp: http.client.HTTPResponse, url: str) -> None:
+        self._conn = conn
+        self._resp = resp
+        self.url = url
+        self.status = resp.status
+        self.headers = resp.msg
+
+    def geturl(self) -> str:
+        return self.url
+
+    def read(self, amt: int | None = None) -> bytes:
+        return self._resp.read(amt)
+
+    def __enter__(self) -> _PooledResponse:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        # A partly read body would desync the next request on this connection.
+        if not self._resp.isclosed():
+            self._resp.close()
+            self._conn.close()
+
+
+def _pooled_connection(scheme: str, netloc: str, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+    # One connection per (thread, host): fetch workers never share a socket. Each thread keeps
+    # an LRU of at most _HTTP_MAX_IDLE_CONNS hosts and drops sockets idle past _HTTP_IDLE_SECONDS.
+    conns = getattr(_HTTP_LOCAL, "conns", None)
+    if conns is None:
+        conns = _HTTP_LOCAL.conns = {}
+    now = time.monotonic()
+    key = (scheme, netloc)
+    # Re-inserting on every use keeps the dict in least-recently-used order.
+    conn, _ = conns.pop(key, (None, 0.0))
+    for other, (idle_conn, last_used) in list(conns.items()):
+        if len(conns) >= _HTTP_MAX_IDLE_CONNS or now - last_used > _HTTP_IDLE_SECONDS:
+            idle_conn.close()
+            del conns[other]
+    if conn is None:
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = cls(netloc, timeout=timeout)
+    conns[key] = (conn, now)
+    conn.timeout = timeout
+    if conn.sock is None:
+        return conn, False
+    # An idle keep-alive socket that is readable has been closed by the server.
+    try:
+        stale = bool(select.select([conn.sock], [], [], 0)[0])
+    except (OSError, ValueError):
+        stale = True
+    if stale:
+        conn.close()
+        return conn, False
+    conn.sock.settimeout(timeout)
+    return conn, True
+
+
+def _uses_proxy(scheme: str, host: str) -> bool:
+    return scheme in urllib.request.getproxies() and not urllib.request.proxy_bypass(host)
+
+
+def http_open(
+    url: str,
+    data: bytes | None = None,
+    headers: Dict[str, str] | None = None,
+    method: str | None = None,
+    timeout: float = 20,
+):
+    # urlopen() work-alike that keeps connections alive per host, so fallback feeds,
+    # article pages and Telegram calls skip repeated TCP/TLS handshakes. Proxied and
+    # non-HTTP URLs go through urlopen() unchanged.
+    method = method or ("POST" if data is not None else "GET")
+    headers = dict(headers or {})
+    for _ in range(_HTTP_MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https") or _uses_proxy(parts.scheme, parts.hostname or ""):
+            req = urllib.request.Request(url, data=data, headers=headers, method=method)
+            return urllib.request.urlopen(req, timeout=timeout)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        conn, reused = _pooled_connection(parts.scheme, parts.netloc, timeout)
+        try:
+            conn.request(method, target, body=data, headers=headers)
+            resp = conn.getresponse()
+        except (ConnectionError, http.client.BadStatusLine):
+            conn.close()
+            # Only an idempotent request on a reused socket is safe to replay.
+            if not reused or method not in ("GET", "HEAD"):
+                raise
+            conn.request(method, target, body=data, headers=headers)
+            resp = conn.getresponse()
+        except Exception:
+            conn.close()
+            raise
+        location = resp.getheader("Location")
+        if resp.status in _HTTP_REDIRECTS and location and method in ("GET", "HEAD"):
+            resp.read()
+            url = urllib.parse.urljoin(url, location)
+            continue
+        if resp.status >= 400 or resp.status in _HTTP_REDIRECTS:
+            body = resp.read()
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.msg, io.BytesIO(body))
+        return _PooledResponse(conn, resp, url)
+    raise urllib.error.HTTPError(url, resp.status, "Too many redirects", resp.msg, None)
 
 
 def local_name(tag: str) -> str:
     return tag.split("}", 1)[-1] if "}" in tag else tag
 
 
-def text_or_empty(elem: ET.Element, child_name: str) -> str:
-    for child in list(elem):
-        if local_name(child.tag).lower() == child_name.lower():
-            return (child.text or "").strip()
-    return ""
+def child_elements(elem: ET.Element) -> Dict[str, ET.Element]:
+    # First child per lower-cased local name: one scan serves every field lookup.
+    out: Dict[str, ET.Element] = {}
+    for child in elem:
+        out.setdefault(local_name(child.tag).lower(), child)
+    return out
 
 
-def rss_item_image_url(item: ET.Element) -> str:
-    for child in list(item):
-        name = local_name(child.tag).lower()
-        if name == "image":
-            url = (child.text or "").strip()
-            if url:
-                return url
-        if name in ("content", "thumbnail"):
-            url = (child.attrib.get("url") or "").strip()
-            if url:
-                return url
-        if name == "enclosure":
-            type_value = (child.attrib.get("type") or "").lower()
-            url = (child.attrib.get("url") or "").strip()
-            if url and type_value.startswith("image"):
-                return url
+def child_text(children: Dict[str, ET.Element], name: str) -> str:
+    child = children.get(name)
+    return (child.text or "").strip() if child is not None else ""
+
+
+def rss_child_image_url(name: str, child: ET.Element) -> str:
+    if name == "image":
+        return (child.text or "").strip()
+    if name in ("content", "thumbnail"):
+        return (child.attrib.get("url") or "").strip()
+    if name == "enclosure":
+        url = (child.attrib.get("url") or "").strip()
+        if url and (child.attrib.get("type") or "").lower().startswith("image"):
+            return url
     return ""
 
 
-def parse_rss_items(root: ET.Element) -> List[dict]:
-    out = []
-    for item in root.iter():
-        if local_name(item.tag).lower() != "item":
-            continue
-        title = text_or_empty(item, "title")
-        link = normalize_news_link(text_or_empty(item, "link"))
-        published = text_or_empty(item, "pubDate") or text_or_empty(item, "published")
-        guid = text_or_empty(item, "guid")
-        image_url = normalize_image_url(rss_item_image_url(item))
-        out.append(
-            {
-                "id": guid or link or title,
-                "title": title,
-                "link": link,
-                "published": published,
-                "image_url": image_url,
-            }
-        )
-    return out
+def rss_item_entry(item: ET.Element) -> dict:
+    # One scan of the children builds the field map and finds the first image.
+    children: Dict[str, ET.Element] = {}
+    image_url = ""
+    for child in item:
+        name = local_name(child.tag).lower()
+        children.setdefault(name, child)
+        if not image_url:
+            image_url = rss_child_image_url(name, child)
+    title = child_text(children, "title")
+    link = normalize_news_link(child_text(children, "link"))
+    published = child_text(children, "pubdate") or child_text(children, "published")
+    guid = child_text(children, "guid")
+    image_url = normalize_image_url(image_url)
+    return {
+        "id": guid or link or title,
+        "title": title,
+        "link": link,
+        "published": published,
+        "image_url": image_url,
+    }
 
 
 def normalize_news_link(link: str) -> str:
     link = (link or "").strip()
     if not link:
         return ""
+    # Only Bing click-tracking links are rewritten; skip parsing everything else.
+    if "/news/apiclick.aspx" not in link:
+        return link
     try:
         u = urllib.parse.urlparse(link)
         host = (u.netloc or "").lower()
@@ -740,12 +1074,18 @@ def normalize_news_link(link: str) -> str:
     return link
 
 
+# Pure string transform; the same feed images and source logos recur every poll.
+@lru_cache(maxsize=2048)
 def normalize_image_url(url: str) -> str:
     url = (url or "").strip()
     if not url:
         return ""
     if url.startswith("http://"):
         url = "https://" + url[len("http://") :]
+    # Only Bing and Google CDN images are rewritten; skip parsing everything else.
+    lowered = url.lower()
+    if "bing.com" not in lowered and "googleusercontent.com" not in lowered:
+        return url
 
     try:
         parsed = urllib.parse.urlparse(url)
@@ -764,8 +1104,8 @@ def normalize_image_url(url: str) -> str:
 
         # Google-hosted images often include width parameters like '=s0-w300-rw'.
         if host.endswith("googleusercontent.com"):
-            url = re.sub(r"=s0-w\\d+(-rw)?", "=s0-w1600-rw", url)
-            url = re.sub(r"=w\\d+-h\\d+(-p)?", "=w1600-h900-p", url)
+            url = _RX_GOOGLE_IMG_S0.sub("=s0-w1600-rw", url)
+            url = _RX_GOOGLE_IMG_WH.sub("=w1600-h900-p", url)
             return url
     except Exception:
         return url
@@ -773,54 +1113,107 @@ def normalize_image_url(url: str) -> str:
     return url
 
 
-def parse_atom_entries(root: ET.Element) -> List[dict]:
-    out = []
-    for entry in root.iter():
-        if local_name(entry.tag).lower() != "entry":
-            continue
+def atom_entry(entry: ET.Element) -> dict:
+    children = child_elements(entry)
+    title = child_text(children, "title")
+    published = child_text(children, "published") or child_text(children, "updated")
+    uid = child_text(children, "id")
+
+    link = ""
+    image_url = ""
+    for child in entry:
+        if local_name(child.tag).lower() == "link":
+            href = (child.attrib.get("href") or "").strip()
+            rel = (child.attrib.get("rel") or "alternate").strip().lower()
+            type_value = (child.attrib.get("type") or "").lower()
+            if href and rel == "alternate":
+                link = href
+            if href and rel == "enclosure" and type_value.startswith("image"):
+                image_url = normalize_image_url(href)
+
+    return {
+        "id": uid or link or title,
+        "title": title,
+        "link": link,
+        "published": published,
+        "image_url": image_url,
+    }
 
-        title = text_or_empty(entry, "title")
-        published = text_or_empty(entry, "published") or text_or_empty(entry, "updated")
-        uid = text_or_empty(entry, "id")
-
-        link = ""
-        image_url = ""
-        for child in list(entry):
-            if local_name(child.tag).lower() == "link":
-                href = (child.attrib.get("href") or "").strip()
-                rel = (child.attrib.get("rel") or "alternate").strip().lower()
-                type_value = (child.attrib.get("type") or "").lower()
-                if href and rel == "alternate":
-                    link = href
-                if href and rel == "enclosure" and type_value.startswith("image"):
-                    image_url = normalize_image_url(href)
-
-        out.append(
-            {
-                "id": uid or link or title,
-                "title": title,
-                "link": link,
-                "published": published,
-                "image_url": image_url,
-            }
-        )
-    return out
+
+FEED_READ_CHUNK = 64 * 1024
 
 
 def fetch_entries(url: str) -> List[dict]:
-    data = http_get_bytes(url)
-    root = ET.fromstring(data)
-    root_name = local_name(root.tag).lower()
+    # Parse while the body streams in: each item/entry is extracted when it closes
+    # and then cleared, so neither the raw feed nor the full tree is held at once.
+    rss_items: List[dict] = []
+    atom_items: List[dict] = []
+    parser = ET.XMLPullParser(events=("start", "end"))
+    root: ET.Element | None = None
+
+    def drain() -> None:
+        nonlocal root
+        for event, elem in parser.read_events():
+            if event == "start":
+                if root is None:
+                    root = elem
+                continue
+            name = local_name(elem.tag).lower()
+            if name == "item":
+                rss_items.append(rss_item_entry(elem))
+                elem.clear()
+            elif name == "entry":
+                atom_items.append(atom_entry(elem))
+                elem.clear()
+
+    with http_open(url, headers={"User-Agent": BROWSER_USER_AGENT}, timeout=20) as resp:
+        while chunk := resp.read(FEED_READ_CHUNK):
+            parser.feed(chunk)
+            drain()
+    parser.close()
+    drain()
+    root_name = local_name(root.tag).lower() if root is not None else ""
 
     if root_name == "rss":
-        return parse_rss_items(root)
+        return rss_items
     if root_name == "feed":
-        return parse_atom_entries(root)
+        return atom_items
+    return rss_items or atom_items
+
 
-    entries = parse_rss_items(root)
-    if entries:
-        return entries
-    return parse_atom_entries(root)
+def fetch_source_entries(source: str, url: str) -> tuple[List[dict], str, Exception | None]:
+    # Try the primary feed, then fallbacks; returns (entries, used_url, last_error).
+    last_exc: Exception | None = None
+    for candidate_url in source_feed_candidates(source, url):
+        try:
+            return fetch_entries(candidate_url), candidate_url, None
+        except Exception as exc:
+            last_exc = exc
+    return [], "", last_exc
+
+
+# Fetch workers outlive a poll cycle so their thread-local keep-alive connections
+# are reused by the next one instead of reconnecting to every feed host.
+_FETCH_POOLS: Dict[int, ThreadPoolExecutor] = {}
+
+
+def _fetch_pool(workers: int) -> ThreadPoolExecutor:
+    pool = _FETCH_POOLS.get(workers)
+    if pool is None:
+        pool = _FETCH_POOLS[workers] = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetch")
+    return pool
+
+
+def fetch_all_sources(
+    source_feeds: Mapping[str, str], max_workers: int
+) -> Dict[str, tuple[List[dict], str, Exception | None]]:
+    # Fetching is network-bound: overlap the sources, keep results in source order.
+    workers = min(max_workers, len(source_feeds))
+    if workers <= 1:
+        return {source: fetch_source_entries(source, url) for source, url in source_feeds.items()}
+    pool = _fetch_pool(workers)
+    futures = {source: pool.submit(fetch_source_entries, source, url) for source, url in source_feeds.items()}
+    return {source: fut.result() for source, fut in futures.items()}
 
 
 def entry_uid(entry: dict) -> str:
@@ -835,7 +1228,7 @@ def entry_time_text(entry: dict) -> str:
 
 
 def parse_keywords(raw: str) -> List[str]:
-    return [x.strip().lower() for x in raw.split(",") if x.strip()]
+    return list(dict.fromkeys(x for tok in raw.split(",") if (x := tok.strip().lower())))
 
 
 def parse_hour_slots(raw: str, default_hours: List[int]) -> List[int]:
@@ -855,35 +1248,20 @@ def parse_hour_slots(raw: str, default_hours: List[int]) -> List[int]:
     return sorted(vals)
 
 
-def build_keyword_patterns(keywords: List[str]) -> List[re.Pattern]:
-    patterns = []
-    for kw in keywords:
-        kw = (kw or "").strip()
-        if not kw:
-            continue
+def build_keyword_patterns(keywords: List[str]) -> List[KeywordMatcher]:
+    # A single combined matcher; kept as a list so is_major_news' any() stays unchanged.
+    matcher = KeywordMatcher(keywords, fold_non_ascii=True)
+    return [matcher] if matcher else []
 
-        is_ascii = kw.isascii()
-        if is_ascii:
-            # For ASCII keywords:
-            # - Match full words / phrases (avoid matching inside other words: fed != federal).
-            # - Allow hyphen in multi-word phrases (e.g. "White-House").
-            part = r"[\s\-]+".join(re.escape(p) for p in kw.split())
-            patterns.append(
-                re.compile(r"(?<![A-Za-z0-9_])" + part + r"(?![A-Za-z0-9_])", re.IGNORECASE)
-            )
-        else:
-            # For non-ASCII (e.g. CJK), \b word boundary is unreliable (titles often have no spaces).
-            # Use substring match instead.
-            patterns.append(re.compile(re.escape(kw), re.IGNORECASE))
-    return patterns
 
-
-def is_major_news(entry: dict, keyword_patterns: List[re.Pattern]) -> bool:
+def is_major_news(entry: dict, keyword_patterns: List[KeywordMatcher], lower_title: str | None = None) -> bool:
     title = (entry.get("title") or "").strip()
-    lower_title = title.lower()
+    if lower_title is None:
+        lower_title = title.lower()
     if "opinion" in lower_title:
         return False
-    return any(p.search(title) for p in keyword_patterns)
+    folded = lower_title if title.isascii() else fold_title(title)
+    return any(p.matches(title, folded) for p in keyword_patterns)
 
 
 def is_quiet_time(now_local: datetime, quiet_start: int, quiet_end: int) -> bool:
@@ -902,22 +1280,137 @@ def build_caption(source: str, entry: dict, prefix: str = "") -> str:
     return text[:1024]
 
 
+# Compact UTF-8 JSON: no \uXXXX escaping (CJK text shrinks ~3x) and no separator
+# whitespace. Built once, since json.dumps() with options builds an encoder per call.
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def encode_json(payload: object) -> bytes:
+    return _JSON_ENCODER.encode(payload).encode("utf-8")
+
+
+class _TokenBucket:
+    # Classic token bucket: `rate` tokens per second, bursts of up to `capacity`.
+    __slots__ = ("rate", "capacity", "tokens", "stamp", "lock")
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.stamp = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.stamp) * self.rate)
+                self.stamp = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# Telegram allows ~30 messages/s per bot and ~1 message/s per chat; pacing sends
+# below that avoids 429s whose retry_after stalls are far costlier than the wait.
+TELEGRAM_BOT_RATE = 30.0
+TELEGRAM_CHAT_RATE = 1.0
+TELEGRAM_MAX_RETRY_AFTER = 60
+# Attempts per call when Telegram answers 429 or 5xx; other errors raise at once.
+TELEGRAM_MAX_TRIES = 3
+_TG_LIMIT_LOCK = threading.Lock()
+_TG_BUCKETS: Dict[Tuple[str, str], _TokenBucket] = {}
+_TG_PAUSED_UNTIL: Dict[str, float] = {}
+
+
+def _telegram_bucket(token: str, chat_id: str) -> _TokenBucket:
+    bucket = _TG_BUCKETS.get((token, chat_id))
+    if bucket is None:
+        rate = TELEGRAM_CHAT_RATE if chat_id else TELEGRAM_BOT_RATE
+        bucket = _TG_BUCKETS[(token, chat_id)] = _TokenBucket(rate, rate)
+    return bucket
+
+
+def _telegram_throttle(token: str, chat_id: str) -> None:
+    with _TG_LIMIT_LOCK:
+        pause = _TG_PAUSED_UNTIL.get(token, 0.0) - time.monotonic()
+        buckets = [_telegram_bucket(token, chat_id)] if chat_id else []
+        buckets.append(_telegram_bucket(token, ""))
+    if pause > 0:
+        time.sleep(pause)
+    for bucket in buckets:
+        bucket.acquire()
+
+
+def _telegram_retry_after(exc: urllib.error.HTTPError) -> int:
+    try:
+        body = json.loads(exc.read().decode("utf-8"))
+        return int((body.get("parameters") or {}).get("retry_after") or 0)
+    except Exception:
+        return 0
+
+
 def telegram_api_json(token: str, method: str, payload: dict) -> dict:
     url = f"https://api.telegram.org/bot{token}/{method}"
-    raw = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(
-        url,
-        data=raw,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
-    with urllib.request.urlopen(req, timeout=20) as resp:
-        data = json.loads(resp.read().decode("utf-8"))
+    raw = encode_json(payload)
+    chat_id = str(payload.get("chat_id") or "")
+    for attempt in range(TELEGRAM_MAX_TRIES):
+        _telegram_throttle(token, chat_id)
+        try:
+            with http_open(url, data=raw, headers={"Content-Type": "application/json"}, method="POST", timeout=20) as resp:
+                data = json.loads(resp.read())
+            break
+        except urllib.error.HTTPError as exc:
+            if attempt == TELEGRAM_MAX_TRIES - 1:
+                raise
+            if exc.code == 429:
+                retry_after = _telegram_retry_after(exc)
+                if not 0 < retry_after <= TELEGRAM_MAX_RETRY_AFTER:
+                    raise
+                # A 429 applies to the whole bot: hold every chat's sends until it passes.
+                with _TG_LIMIT_LOCK:
+                    until = time.monotonic() + retry_after
+                    _TG_PAUSED_UNTIL[token] = max(_TG_PAUSED_UNTIL.get(token, 0.0), until)
+                logging.warning("Telegram 限流(429)，%s 秒后重试 method=%s", retry_after, method)
+            elif 500 <= exc.code < 600:
+                # Jittered so the primary and the secondary worker do not retry in lockstep.
+                delay = min(2**attempt, 10) * random.uniform(0.5, 1.0)
+                logging.warning("Telegram 服务端错误(%s)，%.1f 秒后重试 method=%s", exc.code, delay, method)
+                time.sleep(delay)
+            else:
+                raise
     if not data.get("ok"):
         raise RuntimeError(f"Telegram API 返回失败: {data}")
     return data
 
 
+# Secondary targets mirror the primary. Once the primary has accepted a message, the
+# mirror send runs on this single worker (so mirror order is kept) and overlaps the
+# next primary send instead of doubling every push's round trips.
+_SECONDARY_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tg-secondary")
+_SECONDARY_PENDING: List[Future] = []
+# monitor_ui sends from its request threads too, so the pending list is shared.
+_SECONDARY_LOCK = threading.Lock()
+_DELIVERY_LOCK = threading.Lock()
+
+
+def _deliver_secondary(send: Callable[[], None]) -> None:
+    with _SECONDARY_LOCK:
+        _SECONDARY_PENDING[:] = [f for f in _SECONDARY_PENDING if not f.done()]
+        _SECONDARY_PENDING.append(_SECONDARY_POOL.submit(send))
+
+
+def wait_secondary_deliveries() -> None:
+    while True:
+        with _SECONDARY_LOCK:
+            if not _SECONDARY_PENDING:
+                return
+            future = _SECONDARY_PENDING.pop(0)
+        future.result()
+
+
 def _reset_delivery_stats() -> None:
     global _DELIVERY_STATS
     _DELIVERY_STATS = {
@@ -932,22 +1425,21 @@ def _bump_delivery(label: str, ok: bool) -> None:
     if label not in ("primary", "secondary"):
         return
     key = "ok" if ok else "fail"
-    _DELIVERY_STATS[label][key] = int(_DELIVERY_STATS[label].get(key, 0)) + 1
+    with _DELIVERY_LOCK:
+        _DELIVERY_STATS[label][key] = int(_DELIVERY_STATS[label].get(key, 0)) + 1
 
 
 def _snapshot_delivery_stats() -> dict:
-    return {
-        "primary": {
-            "ok": int(_DELIVERY_STATS.get("primary", {}).get("ok", 0)),
-            "fail": int(_DELIVERY_STATS.get("primary", {}).get("fail", 0)),
-        },
-        "secondary": {
-            "ok": int(_DELIVERY_STATS.get("secondary", {}).get("ok", 0)),
-            "fail": int(_DELIVERY_STATS.get("secondary", {}).get("fail", 0)),
-        },
-        "alerts_sent": int(_DELIVERY_STATS.get("alerts_sent", 0)),
-        "alerts_fail": int(_DELIVERY_STATS.get("alerts_fail", 0)),
-    }
+    # _DELIVERY_STATS always has the _reset_delivery_stats shape; copy the counters as they stand.
+    with _DELIVERY_LOCK:
+        primary = _DELIVERY_STATS["primary"]
+        secondary = _DELIVERY_STATS["secondary"]
+        return {
+            "primary": {"ok": primary["ok"], "fail": primary["fail"]},
+            "secondary": {"ok": secondary["ok"], "fail": secondary["fail"]},
+            "alerts_sent": _DELIVERY_STATS["alerts_sent"],
+            "alerts_fail": _DELIVERY_STATS["alerts_fail"],
+        }
 
 
 def _telegram_targets(primary_token: str, primary_chat_id: str) -> List[tuple[str, str, str]]:
@@ -994,9 +1486,11 @@ def _notify_push_failure(primary_token: str, primary_chat_id: str, reason: str)
                     "disable_web_page_preview": True,
                 },
             )
-            _DELIVERY_STATS["alerts_sent"] = int(_DELIVERY_STATS.get("alerts_sent", 0)) + 1
+            with _DELIVERY_LOCK:
+                _DELIVERY_STATS["alerts_sent"] = int(_DELIVERY_STATS.get("alerts_sent", 0)) + 1
         except Exception:
-            _DELIVERY_STATS["alerts_fail"] = int(_DELIVERY_STATS.get("alerts_fail", 0)) + 1
+            with _DELIVERY_LOCK:
+                _DELIVERY_STATS["alerts_fail"] = int(_DELIVERY_STATS.get("alerts_fail", 0)) + 1
             logging.exception("告警发送失败 label=%s chat_id=%s", label, dest_chat)
 
 
@@ -1009,7 +1503,8 @@ def send_telegram_message(
 ) -> None:
     targets = _telegram_targets(token, chat_id)
     _log_push_targets("sendMessage", targets)
-    for idx, (dest_token, dest_chat, label) in enumerate(targets):
+
+    def send(idx: int, dest_token: str, dest_chat: str, label: str) -> None:
         payload = {
             "chat_id": dest_chat,
             "text": text,
@@ -1028,11 +1523,18 @@ def send_telegram_message(
             logging.exception("secondary sendMessage失败，chat_id=%s", dest_chat)
             _notify_push_failure(token, chat_id, f"secondary sendMessage failed: {exc}")
 
+    for idx, target in enumerate(targets):
+        if idx == 0:
+            send(idx, *target)
+        else:
+            _deliver_secondary(partial(send, idx, *target))
+
 
 def send_telegram_photo(token: str, chat_id: str, photo_url: str, caption: str) -> None:
     targets = _telegram_targets(token, chat_id)
     _log_push_targets("sendPhoto", targets)
-    for idx, (dest_token, dest_chat, label) in enumerate(targets):
+
+    def send(idx: int, dest_token: str, dest_chat: str, label: str) -> None:
         try:
             telegram_api_json(
                 dest_token,
@@ -1052,30 +1554,48 @@ def send_telegram_photo(token: str, chat_id: str, photo_url: str, caption: str)
             logging.exception("secondary sendPhoto失败，chat_id=%s url=%s", dest_chat, photo_url)
             _notify_push_failure(token, chat_id, f"secondary sendPhoto failed: {exc}")
 
+    for idx, target in enumerate(targets):
+        if idx == 0:
+            send(idx, *target)
+        else:
+            _deliver_secondary(partial(send, idx, *target))
+
 
 def send_news_item(
-    token: str, chat_id: str, source: str, entry: dict, prefix: str = "", fetch_article_image_enabled: bool = True
+    token: str,
+    chat_id: str,
+    source: str,
+    entry: dict,
+    prefix: str = "",
+    fetch_article_image_enabled: bool = True,
+    article_images: Mapping[str, Future] | None = None,
 ) -> None:
     caption = build_caption(source, entry, prefix=prefix)
     article_image = ""
     if fetch_article_image_enabled:
-        try:
-            article_image = normalize_image_url(fetch_article_image((entry.get("link") or "").strip()))
-        except Exception:
-            logging.exception("抓取正文配图失败，source=%s", source)
-
-    image_candidates = [normalize_image_url((entry.get("image_url") or "").strip()), article_image]
-    image_candidates.extend(normalize_image_url(x) for x in source_logo_candidates(source))
-    image_candidates.append(DEFAULT_FALLBACK_IMAGE)
+        link = (entry.get("link") or "").strip()
+        if article_images is not None and link in article_images:
+            article_image = article_images[link].result()
+        else:
+            article_image = _article_image_or_empty(source, link)
+
+    # Non-empty candidates in priority order, deduplicated once for every target.
+    image_candidates = dict.fromkeys(
+        url
+        for url in (
+            normalize_image_url((entry.get("image_url") or "").strip()),
+            article_image,
+            *map(normalize_image_url, source_logo_candidates(source)),
+            DEFAULT_FALLBACK_IMAGE,
+        )
+        if url
+    )
     targets = _telegram_targets(token, chat_id)
     _log_push_targets(f"news_item source={source}", targets)
-    for dest_token, dest_chat, label in targets:
+
+    def send(dest_token: str, dest_chat: str, label: str) -> None:
         sent = False
-        tried = set()
         for image_url in image_candidates:
-            if not image_url or image_url in tried:
-                continue
-            tried.add(image_url)
             try:
                 telegram_api_json(
                     dest_token,
@@ -1093,7 +1613,7 @@ def send_news_item(
                 logging.exception("sendPhoto失败，target=%s source=%s url=%s", label, source, image_url)
 
         if sent:
-            continue
+            return
 
         try:
             telegram_api_json(
@@ -1116,30 +1636,50 @@ def send_news_item(
         if label == "primary" and (not sent):
             raise RuntimeError("primary目标所有可用图片URL都发送失败且sendMessage也失败")
 
+    for idx, target in enumerate(targets):
+        if idx == 0:
+            send(*target)
+        else:
+            _deliver_secondary(partial(send, *target))
+
+
+def top_counts(counts: Mapping[str, int], n: int) -> List[Tuple[str, int]]:
+    # Highest count first; ties break on the name, which Counter.most_common() would not do.
+    return heapq.nsmallest(n, counts.items(), key=lambda kv: (-kv[1], kv[0]))
+
+
+def _summary_heat(item: dict, source: str, entry: dict, now_local: datetime) -> float:
+    # "heat_now" is a score the caller already computed at this now_local. A buffered
+    # item's stored "heat" is stale (the freshness bonus decays), so recompute that.
+    heat = item.get("heat_now")
+    return compute_news_heat(source, entry, now_local=now_local) if heat is None else heat
+
 
 def build_rule_summary_text(items: List[dict], tz_name: str, now_local: datetime) -> str:
-    source_counts: Dict[str, int] = {}
+    source_counts = Counter(it.get("source") or "未知来源" for it in items)
     grouped: Dict[str, List[dict]] = {}
     topic_order = [x[0] for x in get_summary_topic_rules()] + ["其他动态"]
+    topic_pos: Dict[str, int] = {}
+    for i, t in enumerate(topic_order):
+        topic_pos.setdefault(t, i)
     for it in items:
         src = it.get("source") or "未知来源"
-        source_counts[src] = source_counts.get(src, 0) + 1
         entry = it.get("entry") or {}
-        title = (entry.get("title") or "").strip()
-        topic = detect_topic(title)
+        topic = it.get("topic") or detect_topic(entry.get("title") or "")
         grouped.setdefault(topic, []).append(
             {
                 "item": it,
-                "heat": compute_news_heat(src, entry, now_local=now_local),
+                "heat": _summary_heat(it, src, entry, now_local),
             }
         )
 
-    top_sources = ", ".join(f"{k}:{v}" for k, v in sorted(source_counts.items(), key=lambda kv: (-kv[1], kv[0]))[:5]) or "未知"
+    top = top_counts(source_counts, 5)
+    top_sources = ", ".join(f"{k}:{v}" for k, v in top) or "未知"
     topic_rank = {
         t: (
             sum(x["heat"] for x in rows) / max(1, len(rows)),
             len(rows),
-            -topic_order.index(t) if t in topic_order else -999,
+            -topic_pos.get(t, 999),
         )
         for t, rows in grouped.items()
     }
@@ -1148,7 +1688,7 @@ def build_rule_summary_text(items: List[dict], tz_name: str, now_local: datetime
         key=lambda t: (
             -topic_rank[t][0],  # category average heat desc
             -topic_rank[t][1],  # count desc
-            topic_order.index(t) if t in topic_order else 999,
+            topic_pos.get(t, 999),
         ),
     )
 
@@ -1164,7 +1704,8 @@ def build_rule_summary_text(items: List[dict], tz_name: str, now_local: datetime
             continue
         avg_heat = sum(x["heat"] for x in bucket) / max(1, len(bucket))
         lines.append(f"<b>{html.escape(topic)}（{len(bucket)}，均热度{avg_heat:.1f}）</b>")
-        bucket_sorted = sorted(bucket, key=lambda x: (-x["heat"],))
+        # Only the headlines still under the cap are printed; don't sort the rest.
+        bucket_sorted = heapq.nlargest(SUMMARY_MAX_HEADLINES - idx + 1, bucket, key=lambda x: x["heat"])
         for rec in bucket_sorted:
             if idx > SUMMARY_MAX_HEADLINES:
                 break
@@ -1201,7 +1742,7 @@ def build_ai_summary_text(
         entry = item.get("entry") or {}
         title = (entry.get("title") or "(无标题)").strip().replace("\n", " ")
         link = (entry.get("link") or "").strip()
-        heat = compute_news_heat(source, entry, now_local=now_local)
+        heat = _summary_heat(item, source, entry, now_local)
         events.append(f'{idx}. [{source}] {title}\n热度: {heat:.1f}\n链接: {link}')
 
     system_msg = (
@@ -1217,9 +1758,10 @@ def build_ai_summary_text(
         f"新闻共 {len(items)} 条，以下是前 {len(focus)} 条:\n\n" + "\n\n".join(events)
     )
 
-    req = urllib.request.Request(
+    # Through http_open so the summary workers keep their api.openai.com connection alive.
+    with http_open(
         "https://api.openai.com/v1/chat/completions",
-        data=json.dumps(
+        data=encode_json(
             {
                 "model": model,
                 "messages": [
@@ -1228,15 +1770,15 @@ def build_ai_summary_text(
                 ],
                 "temperature": 0.2,
             }
-        ).encode("utf-8"),
+        ),
         headers={
             "Content-Type": "application/json",
             "Authorization": f"Bearer {api_key}",
         },
         method="POST",
-    )
-    with urllib.request.urlopen(req, timeout=45) as resp:
-        data = json.loads(resp.read().decode("utf-8"))
+        timeout=45,
+    ) as resp:
+        data = json.loads(resp.read())
     text = (
         data.get("choices", [{}])[0]
         .get("message", {})
@@ -1248,6 +1790,11 @@ def build_ai_summary_text(
     return f"【AI新闻汇总】{now_local.strftime('%m-%d %H:%M')} {tz_name}\n{text}"[:3900]
 
 
+# Shared across callers, so at most this many OpenAI requests are in flight at once.
+AI_SUMMARY_CONCURRENCY = 4
+_AI_SUMMARY_POOL = ThreadPoolExecutor(max_workers=AI_SUMMARY_CONCURRENCY, thread_name_prefix="ai-summary")
+
+
 def maybe_send_compact_summary(
     token: str,
     chat_id: str,
@@ -1262,63 +1809,73 @@ def maybe_send_compact_summary(
     if len(items) <= threshold:
         return False
 
-    chunks: List[List[dict]] = []
-    for i in range(0, len(items), max(1, SUMMARY_CHUNK_SIZE)):
-        chunks.append(items[i : i + max(1, SUMMARY_CHUNK_SIZE)])
-    total_chunks = len(chunks)
+    size = max(1, SUMMARY_CHUNK_SIZE)
+    total_chunks = (len(items) + size - 1) // size
+    # Each AI summary is a slow round trip: request every chunk's up front so the calls
+    # overlap, then consume them in chunk order so messages still go out in order.
+    ai_summaries: List[Future] = []
+    if ai_api_key:
+        ai_summaries = [
+            _AI_SUMMARY_POOL.submit(
+                build_ai_summary_text,
+                items=items[start : start + size],
+                tz_name=tz_name,
+                now_local=now_local,
+                api_key=ai_api_key,
+                model=ai_model,
+                max_items=min(max(1, ai_max_items), SUMMARY_CHUNK_SIZE),
+            )
+            for start in range(0, len(items), size)
+        ]
 
-    for idx, chunk_items in enumerate(chunks, start=1):
-        summary_text = ""
-        if ai_api_key:
-            try:
-                summary_text = build_ai_summary_text(
-                    items=chunk_items,
-                    tz_name=tz_name,
-                    now_local=now_local,
-                    api_key=ai_api_key,
-                    model=ai_model,
-                    max_items=min(max(1, ai_max_items), SUMMARY_CHUNK_SIZE),
-                )
-                logging.info(
-                    "AI汇总成功，分片=%s/%s，条数=%s model=%s",
-                    idx,
-                    total_chunks,
-                    len(chunk_items),
-                    ai_model,
-                )
-            except Exception:
-                logging.exception("AI汇总失败，将降级为规则汇总")
+    try:
+        for idx, start in enumerate(range(0, len(items), size), start=1):
+            chunk_items = items[start : start + size]
+            summary_text = ""
+            if ai_api_key:
+                try:
+                    summary_text = ai_summaries[idx - 1].result()
+                    logging.info(
+                        "AI汇总成功，分片=%s/%s，条数=%s model=%s",
+                        idx,
+                        total_chunks,
+                        len(chunk_items),
+                        ai_model,
+                    )
+                except Exception:
+                    logging.exception("AI汇总失败，将降级为规则汇总")
 
-        if not summary_text:
-            summary_text = build_rule_summary_text(items=chunk_items, tz_name=tz_name, now_local=now_local)
+            if not summary_text:
+                summary_text = build_rule_summary_text(items=chunk_items, tz_name=tz_name, now_local=now_local)
 
-        if total_chunks > 1:
-            summary_text = f"<b>【汇总分片 {idx}/{total_chunks}】</b>\n" + summary_text
+            if total_chunks > 1:
+                summary_text = f"<b>【汇总分片 {idx}/{total_chunks}】</b>\n" + summary_text
 
-        html_text = summary_text[:3900]
-        try:
-            send_telegram_message(
-                token,
-                chat_id,
-                html_text,
-                parse_mode="HTML",
-                disable_web_page_preview=True,
-            )
-        except Exception:
-            # Common Telegram 400 causes are malformed/truncated HTML entities.
-            # Keep compact delivery by retrying as plain text instead of per-item fallback.
-            plain_text = re.sub(r"<[^>]+>", "", html_text)
-            plain_text = html.unescape(plain_text).strip()
-            if len(plain_text) > 3900:
-                plain_text = plain_text[:3900]
-            logging.exception("汇总HTML发送失败，降级为纯文本汇总重试")
-            send_telegram_message(
-                token,
-                chat_id,
-                plain_text,
-                parse_mode="",
-                disable_web_page_preview=True,
-            )
+            html_text = summary_text[:3900]
+            try:
+                send_telegram_message(
+                    token,
+                    chat_id,
+                    html_text,
+                    parse_mode="HTML",
+                    disable_web_page_preview=True,
+                )
+            except Exception:
+                # Common Telegram 400 causes are malformed/truncated HTML entities.
+                # Keep compact delivery by retrying as plain text instead of per-item fallback.
+                plain_text = html.unescape(_RX_HTML_TAG.sub("", html_text)).strip()[:3900]
+                logging.exception("汇总HTML发送失败，降级为纯文本汇总重试")
+                send_telegram_message(
+                    token,
+                    chat_id,
+                    plain_text,
+                    parse_mode="",
+                    disable_web_page_preview=True,
+                )
+    finally:
+        # A failed send propagates; drop the AI calls for chunks that will never go out.
+        for fut in ai_summaries:
+            fut.cancel()
     return True
 
 
@@ -1369,6 +1926,11 @@ def flush_low_score_digest_if_due(
     remain = []
     ok = 0
     failed = 0
+    article_images = (
+        prefetch_article_images([(x.get("source") or "未知来源", x.get("entry") or {}) for x in items])
+        if fetch_article_image_enabled
+        else None
+    )
     for item in items:
         source = item.get("source") or "未知来源"
         entry = item.get("entry") or {}
@@ -1380,6 +1942,7 @@ def flush_low_score_digest_if_due(
                 entry,
                 prefix="[低分定时汇总] ",
                 fetch_article_image_enabled=fetch_article_image_enabled,
+                article_images=article_images,
             )
             ok += 1
         except Exception:
@@ -1430,6 +1993,11 @@ def flush_night_digest(
     remain = []
     ok = 0
     failed = 0
+    article_images = (
+        prefetch_article_images([(x.get("source") or "未知来源", x.get("entry") or {}) for x in buffered])
+        if fetch_article_image_enabled
+        else None
+    )
     for item in buffered:
         source = item.get("source") or "未知来源"
         entry = item.get("entry") or {}
@@ -1441,6 +2009,7 @@ def flush_night_digest(
                 entry,
                 prefix="[夜间汇总] ",
                 fetch_article_image_enabled=fetch_article_image_enabled,
+                article_images=article_images,
             )
             ok += 1
         except Exception:
@@ -1475,6 +2044,7 @@ def run(run_once: bool = False) -> None:
     chat_id = os.getenv("TELEGRAM_CHAT_ID", "").strip()
     poll_seconds = int(os.getenv("POLL_SECONDS", "120"))
     max_items_per_source = int(os.getenv("MAX_ITEMS_PER_SOURCE", "3"))
+    fetch_workers = int(os.getenv("FETCH_CONCURRENCY", "8"))
     max_news_age_hours = float(os.getenv("MAX_NEWS_AGE_HOURS", "24"))
     immediate_heat_min = float(os.getenv("IMMEDIATE_HEAT_MIN", "5"))
     low_digest_hours = parse_hour_slots(os.getenv("LOW_SCORE_DIGEST_HOURS", "9,12,15,18,21"), [9, 12, 15, 18, 21])
@@ -1497,9 +2067,20 @@ def run(run_once: bool = False) -> None:
     if not token or not chat_id:
         raise RuntimeError("请先配置 TELEGRAM_BOT_TOKEN 和 TELEGRAM_CHAT_ID")
 
+    # The runner environment is fixed for the life of the process.
+    github_info = {
+        "repo": (os.getenv("GITHUB_REPOSITORY") or "").strip(),
+        "workflow": (os.getenv("GITHUB_WORKFLOW") or "").strip(),
+        "run_id": (os.getenv("GITHUB_RUN_ID") or "").strip(),
+        "run_number": (os.getenv("GITHUB_RUN_NUMBER") or "").strip(),
+        "sha": (os.getenv("GITHUB_SHA") or "").strip(),
+        "ref": (os.getenv("GITHUB_REF") or "").strip(),
+        "run_url": github_run_url(),
+    }
+
     source_feeds = build_source_feeds()
     state = load_state(state_file)
-    state["seen"] = prune_seen(state.get("seen", {}), seen_ttl_hours)
+    state["seen"] = prune_seen(state["seen"], seen_ttl_hours)
 
     logging.info(
         "开始运行，轮询间隔=%s秒，来源数量=%s，时区=%s quiet=%02d-%02d max_age=%sh immediate_heat>%s low_digest_hours=%s",
@@ -1513,194 +2094,172 @@ def run(run_once: bool = False) -> None:
         ",".join(str(x) for x in low_digest_hours),
     )
 
-    while True:
-        try:
-            now_local = datetime.now(tz=news_tz)
-            cycle_ts = now_ts()
-            now_utc = now_local.astimezone(timezone.utc)
-            today_str = now_local.strftime("%Y-%m-%d")
-            quiet_now = is_quiet_time(now_local, quiet_start, quiet_end)
-            _reset_delivery_stats()
-
-            if (not quiet_now) and now_local.hour >= quiet_end and state.get("last_digest_date", "") != today_str:
-                flush_night_digest(
+    next_tick = time.monotonic()
+    try:
+        while True:
+            try:
+                now_local = datetime.now(tz=news_tz)
+                cycle_ts = now_ts()
+                now_utc = now_local.astimezone(timezone.utc)
+                today_str = now_local.strftime("%Y-%m-%d")
+                quiet_now = is_quiet_time(now_local, quiet_start, quiet_end)
+                _reset_delivery_stats()
+
+                if (not quiet_now) and now_local.hour >= quiet_end and state.get("last_digest_date", "") != today_str:
+                    flush_night_digest(
+                        token=token,
+                        chat_id=chat_id,
+                        state=state,
+                        today_str=today_str,
+                        now_local=now_local,
+                        tz_name=tz_name,
+                        summary_threshold=ai_summary_threshold,
+                        ai_api_key=openai_api_key,
+                        ai_model=ai_summary_model,
+                        ai_max_items=ai_summary_max_items,
+                        fetch_article_image_enabled=fetch_article_image_enabled,
+                    )
+
+                low_digest_items = 0
+                low_digest_messages = 0
+                low_digest_items, low_digest_messages = flush_low_score_digest_if_due(
                     token=token,
                     chat_id=chat_id,
                     state=state,
-                    today_str=today_str,
                     now_local=now_local,
                     tz_name=tz_name,
-                    summary_threshold=ai_summary_threshold,
+                    digest_hours=low_digest_hours,
                     ai_api_key=openai_api_key,
                     ai_model=ai_summary_model,
                     ai_max_items=ai_summary_max_items,
                     fetch_article_image_enabled=fetch_article_image_enabled,
                 )
 
-            low_digest_items = 0
-            low_digest_messages = 0
-            low_digest_items, low_digest_messages = flush_low_score_digest_if_due(
-                token=token,
-                chat_id=chat_id,
-                state=state,
-                now_local=now_local,
-                tz_name=tz_name,
-                digest_hours=low_digest_hours,
-                ai_api_key=openai_api_key,
-                ai_model=ai_summary_model,
-                ai_max_items=ai_summary_max_items,
-                fetch_article_image_enabled=fetch_article_image_enabled,
-            )
-
-            sources_ok = 0
-            sources_fail = 0
-            entries_total = 0
-            skipped_seen = 0
-            skipped_old = 0
-            skipped_major = 0
-            skipped_lang = 0
-            pushed_ok = 0
-            pushed_fail = 0
-            low_buffer_added = 0
-            night_buffer_added = 0
-            all_new = []
-            cycle_seen = set()
-            for source, url in source_feeds.items():
-                entries = []
-                used_url = ""
-                last_exc: Exception | None = None
-                for candidate_url in source_feed_candidates(source, url):
-                    try:
-                        entries = fetch_entries(candidate_url)
-                        used_url = candidate_url
-                        break
-                    except Exception as exc:
-                        last_exc = exc
-                        continue
-                if not used_url:
-                    sources_fail += 1
-                    logging.exception("抓取失败: %s", source, exc_info=last_exc)
-                    continue
-                if used_url != url:
-                    logging.info("抓取源fallback命中: %s -> %s", source, used_url)
-                sources_ok += 1
-                entries_total += len(entries)
-                entries_with_dt = [(entry, parse_published_ts(entry)) for entry in entries]
-                entries_with_dt.sort(
-                    key=lambda x: x[1] or datetime.fromtimestamp(0, tz=timezone.utc),
-                    reverse=True,
-                )
-                lang_pref = SOURCE_LANGUAGE_PREFERENCE.get(source, "en")
-                pref_items: List[tuple[dict, datetime | None]] = []
-                fallback_items: List[tuple[dict, datetime | None]] = []
-                for entry, published_dt in entries_with_dt:
-                    lang = detect_entry_language(entry)
-                    if lang not in ALLOWED_PUSH_LANGUAGES:
-                        skipped_lang += 1
+                sources_ok = 0
+                sources_fail = 0
+                entries_total = 0
+                skipped_seen = 0
+                skipped_old = 0
+                skipped_major = 0
+                skipped_lang = 0
+                pushed_ok = 0
+                pushed_fail = 0
+                low_buffer_added = 0
+                night_buffer_added = 0
+                all_new = []
+                cycle_seen = set()
+                seen = state["seen"]
+                fetched = fetch_all_sources(source_feeds, fetch_workers)
+                for source, url in source_feeds.items():
+                    entries, used_url, last_exc = fetched[source]
+                    if not used_url:
+                        sources_fail += 1
+                        logging.exception("抓取失败: %s", source, exc_info=last_exc)
                         continue
-                    if lang == lang_pref:
-                        pref_items.append((entry, published_dt))
-                    else:
-                        fallback_items.append((entry, published_dt))
-                entries_with_dt = pref_items + fallback_items
-
-                new_count = 0
-                for entry, published_dt in entries_with_dt:
-                    uid = entry_uid(entry)
-                    if not uid:
-                        continue
-                    if uid in state["seen"] or uid in cycle_seen:
-                        if uid in state["seen"]:
+                    if used_url != url:
+                        logging.info("抓取源fallback命中: %s -> %s", source, used_url)
+                    sources_ok += 1
+                    entries_total += len(entries)
+                    lang_pref = SOURCE_LANGUAGE_PREFERENCE.get(source, "en")
+                    pref_items: List[tuple[dict, datetime | None]] = []
+                    fallback_items: List[tuple[dict, datetime | None]] = []
+                    for entry in entries:
+                        lang = detect_entry_language(entry)
+                        if lang not in ALLOWED_PUSH_LANGUAGES:
+                            skipped_lang += 1
+                            continue
+                        bucket = pref_items if lang == lang_pref else fallback_items
+                        bucket.append((entry, parse_published_ts(entry)))
+                    # Newest first within each language group (undated last); partitioning before
+                    # the stable sort keeps the same order while skipping dropped languages.
+                    pref_items.sort(key=lambda x: x[1] or _EPOCH_UTC, reverse=True)
+                    fallback_items.sort(key=lambda x: x[1] or _EPOCH_UTC, reverse=True)
+                    entries_with_dt = pref_items + fallback_items
+
+                    new_count = 0
+                    for entry, published_dt in entries_with_dt:
+                        uid = entry_uid(entry)
+                        if not uid:
+                            continue
+                        if uid in seen:
                             skipped_seen += 1
-                        continue
-                    if not published_dt:
-                        skipped_old += 1
-                        continue
-                    age_hours = max(0.0, (now_utc - published_dt).total_seconds() / 3600)
-                    if age_hours > max_news_age_hours:
-                        skipped_old += 1
-                        continue
-
-                    topic = detect_topic(entry.get("title") or "")
-                    war_unfiltered = topic == "战争与冲突"
-                    iran_tagged = is_iran_related(entry)
+                            continue
+                        if uid in cycle_seen:
+                            continue
+                        if not published_dt:
+                            skipped_old += 1
+                            continue
+                        age_hours = max(0.0, (now_utc - published_dt).total_seconds() / 3600)
+                        if age_hours > max_news_age_hours:
+                            skipped_old += 1
+                            continue
+
+                        # Strip/lower the title once for every classifier below.
+                        title = (entry.get("title") or "").strip()
+                        lower_title = title.lower()
+                        topic = detect_topic(title)
+                        war_unfiltered = topic == "战争与冲突"
+                        iran_tagged = is_iran_related(entry, lower_title=lower_title)
+
+                        if (
+                            major_only
+                            and (not war_unfiltered)
+                            and (not iran_tagged)
+                            and (not is_major_news(entry, keyword_patterns, lower_title=lower_title))
+                        ):
+                            skipped_major += 1
+                            continue
+
+                        heat = compute_news_heat(
+                            source, entry, now_local=now_local, published_dt=published_dt, lower_title=lower_title
+                        )
+                        cycle_seen.add(uid)
+                        all_new.append((source, entry, uid, heat, topic, war_unfiltered))
+                        new_count += 1
+                        if new_count >= max_items_per_source:
+                            break
+
+                state["seen"] = prune_seen(state["seen"], seen_ttl_hours)
+
+                if sources_ok == 0:
+                    logging.warning("本轮所有来源抓取均失败（sources_fail=%s），可能是网络/被封/源站变更导致", sources_fail)
+                if entries_total > 0 and len(all_new) == 0:
+                    if major_only and skipped_major > 0:
+                        logging.info(
+                            "本轮有内容但未命中关键词：entries_total=%s skipped_major=%s skipped_seen=%s skipped_old=%s",
+                            entries_total,
+                            skipped_major,
+                            skipped_seen,
+                            skipped_old,
+                        )
+                    else:
+                        logging.info(
+                            "本轮有内容但没有新条目：entries_total=%s skipped_seen=%s skipped_old=%s",
+                            entries_total,
+                            skipped_seen,
+                            skipped_old,
+                        )
 
-                    if major_only and (not war_unfiltered) and (not iran_tagged) and (not is_major_news(entry, keyword_patterns)):
-                        skipped_major += 1
+                if not state.get("initialized", False):
+                    # Seed seen cache on the very first run (prevents historical spam).
+                    for _source, _entry, uid, _heat, _topic, _war in all_new:
+                        state["seen"][uid] = cycle_ts
+                    state["initialized"] = True
+                    save_state_later(state_file, state)
+                    if bootstrap_silent:
+                        logging.info("首次启动完成，已建立去重缓存（静默模式）")
+                        if run_once:
+                            break
+                        next_tick = sleep_until_next_tick(next_tick, poll_seconds)
                         continue
 
-                    heat = compute_news_heat(source, entry, now_local=now_local)
-                    cycle_seen.add(uid)
-                    all_new.append((source, entry, uid, heat, topic, war_unfiltered))
-                    new_count += 1
-                    if new_count >= max_items_per_source:
-                        break
-
-            state["seen"] = prune_seen(state["seen"], seen_ttl_hours)
-
-            if sources_ok == 0:
-                logging.warning("本轮所有来源抓取均失败（sources_fail=%s），可能是网络/被封/源站变更导致", sources_fail)
-            if entries_total > 0 and len(all_new) == 0:
-                if major_only and skipped_major > 0:
-                    logging.info(
-                        "本轮有内容但未命中关键词：entries_total=%s skipped_major=%s skipped_seen=%s skipped_old=%s",
-                        entries_total,
-                        skipped_major,
-                        skipped_seen,
-                        skipped_old,
-                    )
-                else:
-                    logging.info(
-                        "本轮有内容但没有新条目：entries_total=%s skipped_seen=%s skipped_old=%s",
-                        entries_total,
-                        skipped_seen,
-                        skipped_old,
-                    )
-
-            if not state.get("initialized", False):
-                # Seed seen cache on the very first run (prevents historical spam).
-                for _source, _entry, uid, _heat, _topic, _war in all_new:
-                    state["seen"][uid] = cycle_ts
-                state["initialized"] = True
-                save_state(state_file, state)
-                if bootstrap_silent:
-                    logging.info("首次启动完成，已建立去重缓存（静默模式）")
-                    if run_once:
-                        break
-                    time.sleep(poll_seconds)
-                    continue
-
-            immediate_items = []
-            low_buffer = state.get("low_score_buffer", [])
-            for source, entry, uid, heat, topic, war_unfiltered in all_new:
-                if war_unfiltered or heat > immediate_heat_min:
-                    immediate_items.append((source, entry, uid, heat, topic, war_unfiltered))
-                    continue
-                low_buffer.append(
-                    {
-                        "source": source,
-                        "entry": entry,
-                        "uid": uid,
-                        "heat": heat,
-                        "buffered_ts": cycle_ts,
-                    }
-                )
-                state["seen"][uid] = cycle_ts
-                low_buffer_added += 1
-            state["low_score_buffer"] = low_buffer
-
-            if low_buffer_added:
-                logging.info("低分新闻已缓存，新增=%s 当前缓存=%s", low_buffer_added, len(low_buffer))
-
-            if quiet_now and immediate_items:
-                night_buffer = state.get("night_buffer", [])
-                if not isinstance(night_buffer, list):
-                    night_buffer = []
-                buffered_uids = {str(x.get("uid")) for x in night_buffer if isinstance(x, dict) and x.get("uid")}
-                for source, entry, uid, heat, _topic, _war in immediate_items:
-                    if uid in buffered_uids:
+                immediate_items = []
+                low_buffer = state["low_score_buffer"]
+                for source, entry, uid, heat, topic, war_unfiltered in all_new:
+                    if war_unfiltered or heat > immediate_heat_min:
+                        immediate_items.append((source, entry, uid, heat, topic, war_unfiltered))
                         continue
-                    night_buffer.append(
+                    low_buffer.append(
                         {
                             "source": source,
                             "entry": entry,
@@ -1710,128 +2269,160 @@ def run(run_once: bool = False) -> None:
                         }
                     )
                     state["seen"][uid] = cycle_ts
-                    night_buffer_added += 1
-                    buffered_uids.add(uid)
-                state["night_buffer"] = night_buffer
-                immediate_items = []
-                if night_buffer_added:
-                    logging.info("夜间免打扰生效，高分新闻转入夜间缓存，新增=%s 当前夜间缓存=%s", night_buffer_added, len(night_buffer))
-
-            compact_items = [{"source": s, "entry": e, "uid": u} for s, e, u, _h, _topic, _war in immediate_items]
-            sent_compact = False
-            try:
-                sent_compact = maybe_send_compact_summary(
-                    token=token,
-                    chat_id=chat_id,
-                    items=compact_items,
-                    tz_name=tz_name,
-                    now_local=now_local,
-                    threshold=ai_summary_threshold,
-                    ai_api_key=openai_api_key,
-                    ai_model=ai_summary_model,
-                    ai_max_items=ai_summary_max_items,
-                )
-            except Exception:
-                logging.exception("高分新闻汇总推送失败，将回退逐条发送")
+                    low_buffer_added += 1
+                state["low_score_buffer"] = low_buffer
+
+                if low_buffer_added:
+                    logging.info("低分新闻已缓存，新增=%s 当前缓存=%s", low_buffer_added, len(low_buffer))
+
+                if quiet_now and immediate_items:
+                    night_buffer = state["night_buffer"]
+                    buffered_uids = {str(x.get("uid")) for x in night_buffer if isinstance(x, dict) and x.get("uid")}
+                    for source, entry, uid, heat, _topic, _war in immediate_items:
+                        if uid in buffered_uids:
+                            continue
+                        night_buffer.append(
+                            {
+                                "source": source,
+                                "entry": entry,
+                                "uid": uid,
+                                "heat": heat,
+                                "buffered_ts": cycle_ts,
+                            }
+                        )
+                        state["seen"][uid] = cycle_ts
+                        night_buffer_added += 1
+                        buffered_uids.add(uid)
+                    state["night_buffer"] = night_buffer
+                    immediate_items = []
+                    if night_buffer_added:
+                        logging.info("夜间免打扰生效，高分新闻转入夜间缓存，新增=%s 当前夜间缓存=%s", night_buffer_added, len(night_buffer))
+
+                # Heat and topic were just computed for this cycle; carry them into the summary.
+                compact_items = [
+                    {"source": s, "entry": e, "uid": u, "heat_now": h, "topic": topic}
+                    for s, e, u, h, topic, _war in immediate_items
+                ]
                 sent_compact = False
+                try:
+                    sent_compact = maybe_send_compact_summary(
+                        token=token,
+                        chat_id=chat_id,
+                        items=compact_items,
+                        tz_name=tz_name,
+                        now_local=now_local,
+                        threshold=ai_summary_threshold,
+                        ai_api_key=openai_api_key,
+                        ai_model=ai_summary_model,
+                        ai_max_items=ai_summary_max_items,
+                    )
+                except Exception:
+                    logging.exception("高分新闻汇总推送失败，将回退逐条发送")
+                    sent_compact = False
 
-            if sent_compact:
-                for _source, _entry, uid, _heat, _topic, _war in immediate_items:
-                    state["seen"][uid] = cycle_ts
-                pushed_ok += 1
-                logging.info("已推送高分汇总消息，覆盖条数=%s", len(immediate_items))
-            else:
-                for source, entry, uid, _heat, _topic, _war in immediate_items:
-                    try:
-                        send_news_item(
-                            token, chat_id, source, entry, fetch_article_image_enabled=fetch_article_image_enabled
-                        )
+                if sent_compact:
+                    for _source, _entry, uid, _heat, _topic, _war in immediate_items:
                         state["seen"][uid] = cycle_ts
-                        pushed_ok += 1
-                        logging.info("已推送: %s | %s", source, entry.get("title", ""))
-                    except Exception:
-                        pushed_fail += 1
-                        logging.exception("推送失败: %s", source)
-
-            checkout_sha = try_git(["git", "rev-parse", "HEAD"])
-            checkout_ref = try_git(["git", "rev-parse", "--abbrev-ref", "HEAD"])
-            if checkout_ref == "HEAD":
-                checkout_ref = ""
-            delivery = _snapshot_delivery_stats()
-
-            utc_now = datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
-            state["last_run"] = {
-                "utc": utc_now,
-                "local": now_local.replace(microsecond=0).isoformat(),
-                "tz": tz_name,
-                "local_hour": now_local.hour,
-                "quiet": quiet_now,
-                "sources_ok": sources_ok,
-                "sources_fail": sources_fail,
-                "entries_total": entries_total,
-                "new": len(all_new),
-                "pushed_ok": pushed_ok,
-                "pushed_fail": pushed_fail,
-                "skipped_seen": skipped_seen,
-                "skipped_old": skipped_old,
-                "skipped_major": skipped_major,
-                "skipped_lang": skipped_lang,
-                "buffered_total": len(state.get("night_buffer", [])),
-                "buffered_added": night_buffer_added,
-                "low_buffer_total": len(state.get("low_score_buffer", [])),
-                "low_buffer_added": low_buffer_added,
-                "low_digest_items": low_digest_items,
-                "low_digest_messages": low_digest_messages,
-                "delivery": delivery,
-                "seen_size": len(state.get("seen", {})) if isinstance(state.get("seen"), dict) else 0,
-                "github": {
-                    "repo": (os.getenv("GITHUB_REPOSITORY") or "").strip(),
-                    "workflow": (os.getenv("GITHUB_WORKFLOW") or "").strip(),
-                    "run_id": (os.getenv("GITHUB_RUN_ID") or "").strip(),
-                    "run_number": (os.getenv("GITHUB_RUN_NUMBER") or "").strip(),
-                    "sha": (os.getenv("GITHUB_SHA") or "").strip(),
-                    "ref": (os.getenv("GITHUB_REF") or "").strip(),
-                    "run_url": github_run_url(),
-                },
-                "checkout": {
-                    "ref": checkout_ref,
-                    "sha": checkout_sha,
-                },
-            }
+                    pushed_ok += 1
+                    logging.info("已推送高分汇总消息，覆盖条数=%s", len(immediate_items))
+                else:
+                    article_images = (
+                        prefetch_article_images([(s, e) for s, e, _u, _h, _topic, _war in immediate_items])
+                        if fetch_article_image_enabled
+                        else None
+                    )
+                    for source, entry, uid, _heat, _topic, _war in immediate_items:
+                        try:
+                            send_news_item(
+                                token,
+                                chat_id,
+                                source,
+                                entry,
+                                fetch_article_image_enabled=fetch_article_image_enabled,
+                                article_images=article_images,
+                            )
+                            state["seen"][uid] = cycle_ts
+                            pushed_ok += 1
+                            logging.info("已推送: %s | %s", source, entry.get("title", ""))
+                        except Exception:
+                            pushed_fail += 1
+                            logging.exception("推送失败: %s", source)
+
+                checkout_sha, checkout_ref = checkout_info()
+                wait_secondary_deliveries()
+                delivery = _snapshot_delivery_stats()
+                night_buffer_total = len(state["night_buffer"])
+                low_buffer_total = len(state["low_score_buffer"])
+                seen_size = len(state["seen"])
+
+                utc_now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+                state["last_run"] = {
+                    "utc": utc_now,
+                    "local": now_local.replace(microsecond=0).isoformat(),
+                    "tz": tz_name,
+                    "local_hour": now_local.hour,
+                    "quiet": quiet_now,
+                    "sources_ok": sources_ok,
+                    "sources_fail": sources_fail,
+                    "entries_total": entries_total,
+                    "new": len(all_new),
+                    "pushed_ok": pushed_ok,
+                    "pushed_fail": pushed_fail,
+                    "skipped_seen": skipped_seen,
+                    "skipped_old": skipped_old,
+                    "skipped_major": skipped_major,
+                    "skipped_lang": skipped_lang,
+                    "buffered_total": night_buffer_total,
+                    "buffered_added": night_buffer_added,
+                    "low_buffer_total": low_buffer_total,
+                    "low_buffer_added": low_buffer_added,
+                    "low_digest_items": low_digest_items,
+                    "low_digest_messages": low_digest_messages,
+                    "delivery": delivery,
+                    "seen_size": seen_size,
+                    "github": github_info,
+                    "checkout": {
+                        "ref": checkout_ref,
+                        "sha": checkout_sha,
+                    },
+                }
 
-            save_state(state_file, state)
-            logging.info(
-                "summary tz=%s local_hour=%s quiet=%s sources_ok=%s sources_fail=%s entries_total=%s new=%s pushed_ok=%s pushed_fail=%s skipped_seen=%s skipped_old=%s skipped_major=%s skipped_lang=%s low_buffer=%s low_added=%s low_digest_items=%s delivery_p=%s/%s delivery_s=%s/%s alerts=%s/%s",
-                tz_name,
-                now_local.hour,
-                quiet_now,
-                sources_ok,
-                sources_fail,
-                entries_total,
-                len(all_new),
-                pushed_ok,
-                pushed_fail,
-                skipped_seen,
-                skipped_old,
-                skipped_major,
-                skipped_lang,
-                len(state.get("low_score_buffer", [])),
-                low_buffer_added,
-                low_digest_items,
-                delivery.get("primary", {}).get("ok", 0),
-                delivery.get("primary", {}).get("fail", 0),
-                delivery.get("secondary", {}).get("ok", 0),
-                delivery.get("secondary", {}).get("fail", 0),
-                delivery.get("alerts_sent", 0),
-                delivery.get("alerts_fail", 0),
-            )
-            logging.info("本轮完成，新消息=%s", len(all_new))
-        except Exception:
-            logging.exception("主循环异常")
+                save_state_later(state_file, state)
+                logging.info(
+                    "summary tz=%s local_hour=%s quiet=%s sources_ok=%s sources_fail=%s entries_total=%s new=%s pushed_ok=%s pushed_fail=%s skipped_seen=%s skipped_old=%s skipped_major=%s skipped_lang=%s low_buffer=%s low_added=%s low_digest_items=%s delivery_p=%s/%s delivery_s=%s/%s alerts=%s/%s",
+                    tz_name,
+                    now_local.hour,
+                    quiet_now,
+                    sources_ok,
+                    sources_fail,
+                    entries_total,
+                    len(all_new),
+                    pushed_ok,
+                    pushed_fail,
+                    skipped_seen,
+                    skipped_old,
+                    skipped_major,
+                    skipped_lang,
+                    low_buffer_total,
+                    low_buffer_added,
+                    low_digest_items,
+                    delivery["primary"]["ok"],
+                    delivery["primary"]["fail"],
+                    delivery["secondary"]["ok"],
+                    delivery["secondary"]["fail"],
+                    delivery["alerts_sent"],
+                    delivery["alerts_fail"],
+                )
+                logging.info("本轮完成，新消息=%s", len(all_new))
+            except Exception:
+                logging.exception("主循环异常")
 
-        if run_once:
-            break
-        time.sleep(poll_seconds)
+            if run_once:
+                break
+            next_tick = sleep_until_next_tick(next_tick, poll_seconds)
+    finally:
+        # Also on SIGTERM (see __main__) and on crashes, so the last cycle's state reaches disk.
+        flush_state_writes()
 
 
 if __name__ == "__main__":
@@ -1843,4 +2434,6 @@ if __name__ == "__main__":
         level=logging.INFO,
         format="%(asctime)s %(levelname)s %(message)s",
     )
+    # The monitor stops the engine with SIGTERM; exit through run()'s finally so pending state is flushed.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
     run(run_once=args.once)
@@ -0,0 +1,89 @@
+import random
+import sys
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import monitor_ui  # noqa: E402
+
+
+def _stamp(delta: timedelta) -> str:
+    return (datetime.now(timezone.utc) - delta).replace(microsecond=0).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _reference(rows: list, days: int, limit: int) -> list:
+    # The original filter: drop rows stamped before the window, newest first.
+    cutoff = datetime.now().astimezone() - timedelta(days=max(1, days))
+    out = []
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        dt = monitor_ui._parse_iso(str(row.get("ts") or ""))
+        if dt and dt.astimezone() < cutoff:
+            continue
+        out.append(row)
+    out.sort(key=lambda x: str(x.get("ts") or ""), reverse=True)
+    return out[: max(1, limit)]
+
+
+class HistoryRowsTest(unittest.TestCase):
+    def check(self, rows: list, days: int = 7, limit: int = 500) -> None:
+        got = monitor_ui._history_rows({"h": rows}, "h", days=days, limit=limit)
+        self.assertEqual(got, _reference(rows, days, limit))
+
+    def test_unordered_rows_after_an_old_row(self) -> None:
+        rows = [{"ts": _stamp(timedelta(days=1)), "i": 0}, {"ts": _stamp(timedelta(days=30)), "i": 1}]
+        self.check(rows)
+        self.assertEqual([r["i"] for r in monitor_ui._history_rows({"h": rows}, "h")], [0])
+
+    def test_untimed_rows_in_the_middle(self) -> None:
+        rows = [
+            {"ts": _stamp(timedelta(days=20))},
+            {"i": "untimed"},
+            {"ts": _stamp(timedelta(days=2))},
+            {"ts": ""},
+            {"ts": _stamp(timedelta(hours=1))},
+        ]
+        self.check(rows)
+
+    def test_non_canonical_stamps(self) -> None:
+        local = datetime.now(timezone(timedelta(hours=8)))
+        rows = [
+            {"ts": (local - timedelta(days=10)).isoformat()},
+            {"ts": _stamp(timedelta(days=3))},
+            {"ts": (local - timedelta(days=1)).replace(microsecond=0).isoformat()},
+            {"ts": _stamp(timedelta(hours=2))},
+        ]
+        self.check(rows)
+
+    def test_ordered_rows_with_ties_and_limit(self) -> None:
+        same = _stamp(timedelta(days=1))
+        rows = [{"ts": _stamp(timedelta(days=9))}] + [{"ts": same, "i": i} for i in range(5)]
+        rows.append({"ts": _stamp(timedelta(minutes=5))})
+        for limit in (1, 3, 500):
+            self.check(rows, limit=limit)
+
+    def test_randomized_against_reference(self) -> None:
+        rnd = random.Random(1234)
+        for _ in range(500):
+            rows: list = []
+            for _ in range(rnd.randint(0, 30)):
+                pick = rnd.random()
+                if pick < 0.1:
+                    rows.append({"i": len(rows)})
+                elif pick < 0.15:
+                    rows.append("junk")
+                else:
+                    rows.append({"ts": _stamp(timedelta(hours=rnd.randint(0, 400))), "i": len(rows)})
+            if rnd.random() < 0.5:
+                timed = sorted((r for r in rows if isinstance(r, dict) and "ts" in r), key=lambda r: r["ts"])
+                rows = timed
+            for days in (1, 7, 30):
+                for limit in (1, 5, 500):
+                    self.check(rows, days=days, limit=limit)
+
+
+if __name__ == "__main__":
+    unittest.main()